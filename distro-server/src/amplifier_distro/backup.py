@@ -11,6 +11,7 @@ All paths are derived from conventions.py constants -- no hardcoded paths.
 
 from __future__ import annotations
 
+import os
 import shutil
 import subprocess
 import tempfile
@@ -64,9 +65,37 @@ def collect_backup_files(amplifier_home: Path) -> list[Path]:
         if path.is_file():
             files.append(path)
         elif path.is_dir():
-            files.extend(child for child in path.rglob("*") if child.is_file())
+            files.extend(Path(p) for p in _walk_files(str(path)))
 
-    return sorted(files)
+    files.sort()
+    return files
+
+
+def _walk_files(root: str) -> list[str]:
+    """Return every file below *root*, without following directory symlinks.
+
+    Same result as ``rglob("*")`` filtered by ``is_file()``, but the
+    scandir entries answer the file/dir checks from the directory listing
+    instead of one ``stat`` per path.  Like ``rglob``, directories or
+    entries that cannot be read are skipped rather than failing the walk.
+    """
+    found: list[str] = []
+    pending = [root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    found.append(entry.path)
+            except OSError:
+                continue
+    return found
 
 
 # ---------------------------------------------------------------------------
@@ -17,6 +17,7 @@ Usage::
 
 from __future__ import annotations
 
+import copy
 import logging
 import os
 from dataclasses import asdict, dataclass, field
@@ -27,6 +28,11 @@ import yaml
 
 from amplifier_distro import conventions
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
@@ -148,20 +154,53 @@ def _nested_from_dict(cls: type, data: dict[str, Any]) -> Any:
     return cls(**filtered)
 
 
+# (path, st_mtime_ns, st_size, parsed settings) from the last load()/save().
+# Lets back-to-back loads (e.g. wizard /detect then /steps/verify) skip the
+# YAML parse while the file is unchanged.
+_load_cache: tuple[Path, int, int, DistroSettings] | None = None
+
+
+def _remember(path: Path, st: os.stat_result, settings: DistroSettings) -> None:
+    """Cache *settings* as the content of *path* as of the stat *st*.
+
+    *st* must be taken before the read (or after the write) that produced
+    *settings*; a later stat could describe a newer file than was parsed.
+    """
+    global _load_cache
+    _load_cache = (path, st.st_mtime_ns, st.st_size, copy.deepcopy(settings))
+
+
 def load() -> DistroSettings:
-    """Load distro settings from disk, returning defaults for missing values."""
+    """Load distro settings from disk, returning defaults for missing values.
+
+    Each call returns a fresh object; the parsed file is cached until its
+    mtime or size changes.
+    """
     path = _settings_path()
-    if not path.exists():
+    try:
+        st = path.stat()
+    except OSError:
         return DistroSettings()
 
+    cached = _load_cache
+    if (
+        cached is not None
+        and cached[0] == path
+        and cached[1] == st.st_mtime_ns
+        and cached[2] == st.st_size
+    ):
+        return copy.deepcopy(cached[3])
+
     try:
-        raw = yaml.safe_load(path.read_text())
+        raw = yaml.load(path.read_text(), Loader=_YamlLoader)
         if not isinstance(raw, dict):
             return DistroSettings()
-        return _nested_from_dict(DistroSettings, raw)
+        settings = _nested_from_dict(DistroSettings, raw)
     except (OSError, yaml.YAMLError):
         logger.warning("Failed to read distro settings from %s", path, exc_info=True)
         return DistroSettings()
+    _remember(path, st, settings)
+    return settings
 
 
 def save(settings: DistroSettings) -> Path:
@@ -171,6 +210,13 @@ def save(settings: DistroSettings) -> Path:
     path.write_text(
         yaml.dump(asdict(settings), default_flow_style=False, sort_keys=False)
     )
+    global _load_cache
+    try:
+        st = path.stat()
+    except OSError:
+        _load_cache = None
+    else:
+        _remember(path, st, settings)
     return path
 
 
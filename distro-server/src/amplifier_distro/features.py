@@ -272,28 +272,31 @@ class ProviderRegistrationResult:
         return self.key_saved and self.settings_updated and self.overlay_updated
 
 
+# Static part of each GET /providers entry; only the status flags vary.
+_CATALOG_BASE: dict[str, dict[str, object]] = {
+    pid: {
+        "id": pid,
+        "name": p.name,
+        "description": p.description,
+        "console_url": p.console_url,
+        "key_prefix": p.key_prefix,
+    }
+    for pid, p in PROVIDERS.items()
+}
+
+
 def get_provider_catalog() -> list[dict[str, object]]:
     """Build the full provider catalog with configuration status.
 
     Used by both the install wizard and settings app ``GET /providers``.
+    keys.env, settings.yaml and the overlay are read once for the whole
+    catalog rather than once per provider.
     """
-    providers: list[dict[str, object]] = []
-    for pid, p in PROVIDERS.items():
-        status = check_provider_status(pid)
-        providers.append(
-            {
-                "id": pid,
-                "name": p.name,
-                "description": p.description,
-                "console_url": p.console_url,
-                "key_prefix": p.key_prefix,
-                "has_key": status["has_key"],
-                "in_settings": status["in_settings"],
-                "in_overlay": status["in_overlay"],
-                "configured": status["configured"],
-            }
-        )
-    return providers
+    sources = provider_status_sources()
+    return [
+        {**base, **check_provider_status(pid, sources)}
+        for pid, base in _CATALOG_BASE.items()
+    ]
 
 
 def handle_provider_request(
@@ -352,9 +355,39 @@ def handle_provider_request(
     return {"status": "error", "detail": "Provide api_key or provider ID"}
 
 
-def check_provider_status(provider_id: str) -> dict[str, bool]:
+def provider_status_sources() -> tuple[dict[str, str], set[str], set[str]]:
+    """Read what check_provider_status() inspects.
+
+    Returns ``(keys.env entries, provider modules in settings.yaml,
+    overlay include URIs)``.
+    """
+    import yaml
+
+    from amplifier_distro import overlay
+    from amplifier_distro.server.apps.settings import load_keys, load_settings
+
+    keys = load_keys()
+
+    modules: set[str] = set()
+    try:
+        settings = load_settings()
+        providers_list = settings.get("config", {}).get("providers", [])
+        modules = {e.get("module") for e in providers_list}
+    except (yaml.YAMLError, OSError):
+        pass
+
+    return keys, modules, set(overlay.get_includes())
+
+
+def check_provider_status(
+    provider_id: str,
+    sources: tuple[dict[str, str], set[str], set[str]] | None = None,
+) -> dict[str, bool]:
     """Check whether a provider is fully configured across all three sources.
 
+    Pass *sources* (from ``provider_status_sources()``) when checking
+    several providers so the files are read only once.
+
     Returns a dict with:
         has_key      - API key exists in ``os.environ`` or ``keys.env``
         in_settings  - provider module listed in ``settings.yaml``
@@ -363,32 +396,16 @@ def check_provider_status(provider_id: str) -> dict[str, bool]:
     """
     import os
 
-    import yaml
-
-    from amplifier_distro import overlay
-    from amplifier_distro.server.apps.settings import _settings_path, load_keys
-
     provider = PROVIDERS[provider_id]
+    keys, modules, current_uris = sources or provider_status_sources()
 
     # 1. Key in env or keys.env file
-    keys = load_keys()
     has_key = bool(os.environ.get(provider.env_var) or keys.get(provider.env_var))
 
     # 2. Provider module listed in settings.yaml
-    in_settings = False
-    settings_path = _settings_path()
-    if settings_path.exists():
-        try:
-            settings = yaml.safe_load(settings_path.read_text()) or {}
-            providers_list = settings.get("config", {}).get("providers", [])
-            in_settings = any(
-                e.get("module") == provider.module_id for e in providers_list
-            )
-        except (yaml.YAMLError, OSError):
-            pass
+    in_settings = provider.module_id in modules
 
     # 3. Provider include URI in overlay bundle.yaml
-    current_uris = set(overlay.get_includes())
     in_overlay = provider_bundle_uri(provider) in current_uris
 
     return {
@@ -1,15 +1,24 @@
 """File utilities for amplifier-distro.
 
-Provides atomic_write() for crash-safe file persistence.
+Provides atomic_write() for crash-safe file persistence and
+read_env_file() for cached .env parsing (keys.env).
 """
 
 from __future__ import annotations
 
 import contextlib
+import functools
 import os
+import re
 import tempfile
 from pathlib import Path
 
+# One KEY=value assignment per line, surrounding whitespace trimmed; blank,
+# comment ("#...") and "="-less lines don't match. Quotes are peeled after.
+_ENV_LINE_RE = re.compile(
+    r"^[^\S\n]*([^#\s=][^=\n]*?)[^\S\n]*=[^\S\n]*([^\n]*?)[^\S\n]*$", re.M
+)
+
 
 def atomic_write(path: Path, content: str) -> None:
     """Write content to *path* atomically via temp-file + rename.
@@ -40,3 +49,32 @@ def atomic_write(path: Path, content: str) -> None:
         with contextlib.suppress(OSError):
             os.unlink(tmp)
         raise
+
+
+def read_env_file(path: Path) -> dict[str, str]:
+    """Parse a .env-format file (e.g. keys.env) into a fresh dict.
+
+    Returns ``{}`` if *path* doesn't exist. The parse is cached per
+    (path, mtime_ns, size), so an unchanged file is read once no matter
+    how many callers ask; every call still gets its own dict. Read errors
+    propagate to the caller.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return {}
+    return dict(_parse_env_file(str(path), st.st_mtime_ns, st.st_size))
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_env_file(path: str, mtime_ns: int, size: int) -> tuple[tuple[str, str], ...]:
+    # The stat fields in the key drop stale entries; a failed read raises
+    # and so is never cached.
+    text = Path(path).read_text(encoding="utf-8")
+    return tuple((key, _unquote(value)) for key, value in _ENV_LINE_RE.findall(text))
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+        return value[1:-1]
+    return value
@@ -16,6 +16,7 @@ include resolution and composition automatically.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
@@ -152,3 +153,34 @@ def remove_include(uri: str) -> None:
 
     data["includes"] = _filter_includes(data.get("includes", []), uri)
     _write_overlay(data)
+
+
+def update_includes(add: Iterable[str] = (), remove: Iterable[str] = ()) -> None:
+    """Apply several include changes with one read and at most one write.
+
+    URIs in *remove* are dropped, then URIs in *add* are appended in order
+    (skipping ones already present). Surviving includes keep their order.
+    *add* wins when a URI is in both: it ends up included, and stays where
+    it was if it already was. No-op when the overlay does not exist yet.
+    """
+    data = read_overlay()
+    if not data:
+        return  # Overlay must exist first
+
+    original = data.get("includes", [])
+    add = list(dict.fromkeys(add))
+    drop = set(remove).difference(add)
+    includes = [
+        entry
+        for entry in original
+        if (entry.get("bundle") if isinstance(entry, dict) else entry) not in drop
+    ]
+    current_uris = set(get_includes({"includes": includes}))
+    for uri in add:
+        if uri not in current_uris:
+            includes.append({"bundle": uri})
+            current_uris.add(uri)
+
+    if includes != original:
+        data["includes"] = includes
+        _write_overlay(data)
@@ -22,7 +22,6 @@ import hmac
 import json
 import logging
 import os
-import re
 import types
 from datetime import UTC, datetime
 from pathlib import Path
@@ -37,10 +36,18 @@ from amplifier_distro.conventions import (
 )
 from amplifier_distro.server.app import AppManifest
 from amplifier_distro.server.apps.chat.session_history import (
+    is_valid_session_id,
     scan_session_revisions,
-    scan_sessions,
+    scan_sessions_cached,
 )
 
+# orjson is an optional accelerator for transcript parsing, as in
+# session_history; both parsers take bytes and raise ValueError subclasses.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -59,8 +66,6 @@ router = APIRouter()
 
 _static_dir = Path(__file__).parent / "static"
 
-_VALID_SESSION_ID = re.compile(r"^[a-zA-Z0-9_\-]+$")
-
 
 def _parse_session_id_set(values: list[str]) -> set[str]:
     """Validate session IDs and return a de-duplicated set."""
@@ -69,7 +74,7 @@ def _parse_session_id_set(values: list[str]) -> set[str]:
         session_id = (raw or "").strip()
         if not session_id:
             continue
-        if not _VALID_SESSION_ID.fullmatch(session_id):
+        if not is_valid_session_id(session_id):
             raise HTTPException(
                 status_code=400,
                 detail=f"Invalid session ID format: {session_id!r}",
@@ -103,18 +108,17 @@ def _load_transcript_payload(session_id: str) -> dict | None:
     if transcript_file is None:
         return None
 
+    # One read for the whole file; the parser takes the raw bytes lines.
     messages = []
-    with transcript_file.open(encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entry = json.loads(line)
-                if isinstance(entry, dict) and entry.get("role"):
-                    messages.append(entry)
-            except json.JSONDecodeError:
-                continue
+    for line in transcript_file.read_bytes().splitlines():
+        if not line.strip():
+            continue
+        try:
+            entry = _json_loads(line)
+        except ValueError:
+            continue
+        if isinstance(entry, dict) and entry.get("role"):
+            messages.append(entry)
 
     stat = transcript_file.stat()
     last_updated = datetime.fromtimestamp(stat.st_mtime, tz=UTC).isoformat()
@@ -197,7 +201,7 @@ async def list_session_history(
     limit: int = Query(default=200, ge=1, le=1000),
 ) -> dict:
     """Return lightweight metadata for all sessions discovered on disk."""
-    sessions = await asyncio.to_thread(scan_sessions)
+    sessions = await asyncio.to_thread(scan_sessions_cached)
     sessions = [
         row
         for row in sessions
@@ -341,7 +345,7 @@ async def list_sessions() -> dict:
 )
 async def get_transcript(session_id: str) -> JSONResponse:
     """Return the transcript for a session as a JSON array of messages."""
-    if not _VALID_SESSION_ID.fullmatch(session_id):
+    if not is_valid_session_id(session_id):
         return JSONResponse(
             status_code=400,
             content={"error": "Invalid session ID format"},
@@ -13,11 +13,15 @@ import asyncio
 import contextlib
 import hmac
 import logging
-import re
+from collections.abc import Callable, Coroutine
 from typing import TYPE_CHECKING, Any
 
 from starlette.websockets import WebSocketDisconnect
 
+from amplifier_distro.server.apps.chat.session_history import (
+    invalidate_scan_cache,
+    is_valid_session_id,
+)
 from amplifier_distro.server.apps.chat.translator import SessionEventTranslator
 
 if TYPE_CHECKING:
@@ -35,8 +39,8 @@ _EVENT_QUEUE_MAX_SIZE = 10000
 # Sentinel: put into event_queue to stop _event_fanout_loop
 _STOP: object = object()
 
-# Session IDs: alphanumeric, hyphens, underscores only (path traversal prevention)
-_VALID_SESSION_ID = re.compile(r"^[a-zA-Z0-9_\-]+$")
+# Origin prefixes accepted when the server is bound to localhost (CSRF guard)
+_ALLOWED_ORIGIN_PREFIXES = ("http://localhost", "http://127.0.0.1", "https://localhost")
 
 
 class ChatConnection:
@@ -59,6 +63,17 @@ class ChatConnection:
         self._active_execution: asyncio.Task | None = None
         # tracks which local block indices received at least one delta
         self._seen_deltas: set[int] = set()
+        # inbound message type -> handler; one dict lookup per WS frame
+        self._handlers: dict[
+            str, Callable[[dict[str, Any]], Coroutine[Any, Any, None]]
+        ] = {
+            "create_session": self._handle_create_session,
+            "prompt": self._handle_prompt,
+            "cancel": self._handle_cancel,
+            "approval_response": self._handle_approval,
+            "command": self._handle_command_msg,
+            "ping": self._handle_ping,
+        }
 
     async def run(self) -> None:
         """Full connection lifecycle: auth then concurrent receive + fanout."""
@@ -112,11 +127,7 @@ class ChatConnection:
             if server_host not in ("127.0.0.1", "localhost"):
                 pass  # non-localhost host: skip origin restriction
             else:
-                allowed = {"http://localhost", "http://127.0.0.1", "https://localhost"}
-                is_localhost = any(
-                    origin.startswith(allowed_prefix) for allowed_prefix in allowed
-                )
-                if not is_localhost:
+                if not origin.startswith(_ALLOWED_ORIGIN_PREFIXES):
                     logger.warning(
                         "Rejected WebSocket from non-localhost origin: %s", origin
                     )
@@ -170,49 +181,53 @@ class ChatConnection:
 
     async def _dispatch(self, msg_type: str, msg: dict[str, Any]) -> None:
         """Route a received message to the appropriate handler."""
-        match msg_type:
-            case "create_session":
-                await self._handle_create_session(msg)
-
-            case "prompt":
-                content = msg.get("content", "")
-                images = msg.get("images")
-                if self._active_execution and not self._active_execution.done():
-                    await self._ws.send_json(
-                        {
-                            "type": "execution_error",
-                            "error": "Execution in progress. Send cancel first.",
-                        }
-                    )
-                    return
-                task = asyncio.create_task(
-                    self._execute(content, images), name=f"execute-{self._session_id}"
-                )
-                self._active_execution = task
-                self._tasks.add(task)
-                task.add_done_callback(self._tasks.discard)
-
-            case "cancel":
-                level = msg.get("level", "graceful")
-                if self._session_id:
-                    await self._backend.cancel_session(self._session_id, level)
-
-            case "approval_response":
-                req_id = msg.get("id", "")
-                choice = msg.get("choice", "deny")
-                if self._session_id:
-                    self._backend.resolve_approval(self._session_id, req_id, choice)
-
-            case "command":
-                name = msg.get("name", "")
-                args = msg.get("args", [])
-                await self._handle_command(name, args)
-
-            case "ping":
-                await self._ws.send_json({"type": "pong"})
+        handler = self._handlers.get(msg_type)
+        if handler is None:
+            logger.debug("Unknown message type: %s", msg_type)
+            return
+        await handler(msg)
 
-            case _:
-                logger.debug("Unknown message type: %s", msg_type)
+    async def _handle_prompt(self, msg: dict[str, Any]) -> None:
+        """Start executing a prompt unless one is already in flight."""
+        content = msg.get("content", "")
+        images = msg.get("images")
+        if self._active_execution and not self._active_execution.done():
+            await self._ws.send_json(
+                {
+                    "type": "execution_error",
+                    "error": "Execution in progress. Send cancel first.",
+                }
+            )
+            return
+        task = asyncio.create_task(
+            self._execute(content, images), name=f"execute-{self._session_id}"
+        )
+        self._active_execution = task
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _handle_cancel(self, msg: dict[str, Any]) -> None:
+        """Cancel the current session's execution at the requested level."""
+        level = msg.get("level", "graceful")
+        if self._session_id:
+            await self._backend.cancel_session(self._session_id, level)
+
+    async def _handle_approval(self, msg: dict[str, Any]) -> None:
+        """Forward an approval choice to the backend."""
+        req_id = msg.get("id", "")
+        choice = msg.get("choice", "deny")
+        if self._session_id:
+            self._backend.resolve_approval(self._session_id, req_id, choice)
+
+    async def _handle_command_msg(self, msg: dict[str, Any]) -> None:
+        """Unpack a slash-command message and run it."""
+        name = msg.get("name", "")
+        args = msg.get("args", [])
+        await self._handle_command(name, args)
+
+    async def _handle_ping(self, msg: dict[str, Any]) -> None:
+        """Answer a keepalive ping."""
+        await self._ws.send_json({"type": "pong"})
 
     async def _send_json(self, data: dict[str, Any]) -> None:
         """Send a JSON message to the WebSocket client."""
@@ -227,7 +242,9 @@ class ChatConnection:
         resume_session_id = msg.get("resume_session_id")
 
         # --- Input validation (path traversal / injection prevention) ---
-        if resume_session_id and not _VALID_SESSION_ID.match(str(resume_session_id)):
+        # Session IDs: alphanumeric, hyphens, underscores only (path traversal
+        # prevention)
+        if resume_session_id and not is_valid_session_id(str(resume_session_id)):
             await self._send_json(
                 {"type": "error", "error": "Invalid session ID format"}
             )
@@ -266,6 +283,7 @@ class ChatConnection:
 
             self._session_id = session_id
             self._translator.reset()
+            invalidate_scan_cache()
             await self._ws.send_json(
                 {
                     "type": "session_created",
@@ -425,6 +443,9 @@ class ChatConnection:
 
         _server_index = SessionEventTranslator.server_index
         _block_text = SessionEventTranslator.block_text
+        # translator and _seen_deltas are mutated in place, never replaced
+        get_local_index = self._translator.get_local_index
+        seen_add = self._seen_deltas.add
 
         while True:
             raw = await self.event_queue.get()
@@ -437,26 +458,24 @@ class ChatConnection:
                 # dict-format deltas (Anthropic native) previously fell through
                 # to "" and would wrongly suppress the synthetic streaming fallback.
                 if event_name == "content_block:delta":
-                    raw_delta = data.get("delta", "")
-                    if isinstance(raw_delta, dict):
-                        raw_delta = (
-                            raw_delta.get("text") or raw_delta.get("thinking") or ""
-                        )
+                    # Producers emit either a str or a plain dict delta
+                    raw_delta = data.get("delta")
+                    if type(raw_delta) is dict:
+                        raw_delta = raw_delta.get("text") or raw_delta.get("thinking")
+                    # Only non-empty str text is forwarded as a delta; any
+                    # other payload leaves the block eligible for synthesis.
                     if raw_delta and isinstance(raw_delta, str):
-                        local_idx = self._translator.get_local_index(
-                            _server_index(data)
-                        )
-                        self._seen_deltas.add(local_idx)
+                        seen_add(get_local_index(_server_index(data)))
 
                 # Synthetic streaming: if content_end has text but no deltas were seen,
                 # synthesize chunked deltas to animate the response
                 if event_name == "content_block:end":
-                    local_idx = self._translator.get_local_index(_server_index(data))
+                    server_index = _server_index(data)
+                    local_idx = get_local_index(server_index)
                     text = _block_text(data)
                     if text and local_idx not in self._seen_deltas:
                         # Synthesize: send chunked deltas before the end event
                         chunk_size = 12
-                        server_index = _server_index(data)
                         for i in range(0, len(text), chunk_size):
                             chunk = text[i : i + chunk_size]
                             delta_msg = self._translator.translate(
@@ -10,10 +10,10 @@ Schema (one dict per session in scan_sessions() output):
     last_updated: str           — ISO-format mtime of transcript.jsonl (or session dir)
     revision: str               — mtime_ns:size signature for stale-change detection
 
-Performance note: scan_sessions() reads transcript.jsonl for every session.
-Large transcripts (>10k lines) are scanned completely. This is acceptable
-for typical session counts (<200) but should be profiled if latency becomes
-an issue. Future optimization: seek from end of file for last_user_message.
+Performance note: message_count/last_user_message are cached per session in a
+.summary.json sidecar keyed by revision, so scan_sessions() only re-reads
+transcript.jsonl for sessions that changed since the last scan.  A changed
+transcript is scanned completely.
 """
 
 from __future__ import annotations
@@ -21,7 +21,8 @@ from __future__ import annotations
 import json
 import logging
 import os
-import re
+import string
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -33,13 +34,37 @@ from amplifier_distro.conventions import (
     SESSION_INFO_FILENAME,
     TRANSCRIPT_FILENAME,
 )
+from amplifier_distro.fileutil import atomic_write
+
+# orjson is an optional accelerator for transcript parsing; stdlib json
+# accepts the same bytes input and raises the same ValueError subclasses.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
 _AMPLIFIER_HOME_OVERRIDE: str | None = None  # Overridable in tests
-# Same character set as _VALID_SESSION_ID in chat/__init__.py —
-# keep in sync if session ID format changes
-_VALID_SESSION_ID_RE = re.compile(r"^[a-zA-Z0-9_\-]+$")
+# Per-session cache of {revision, message_count, last_user_message} so scans
+# only re-read transcripts whose revision signature changed.
+SESSION_SUMMARY_FILENAME = ".summary.json"
+
+# Short-lived cache for scan_sessions_cached(): collapses rapid UI polling into
+# one filesystem walk.  (monotonic timestamp, amplifier_home, results)
+_SCAN_CACHE_TTL_S = 0.5
+_scan_cache: tuple[float, str, list[dict[str, Any]]] | None = None
+# Allowed session ID characters; also used by the chat routes.  The table
+# deletes every allowed character, so a valid ID translates to "" (cheaper
+# than a regex match on the per-session hot path).
+_SESSION_ID_CHARS_REMOVE = str.maketrans(
+    "", "", string.ascii_letters + string.digits + "_-"
+)
+
+
+def is_valid_session_id(session_id: str) -> bool:
+    """Return True if *session_id* is non-empty and only contains [A-Za-z0-9_-]."""
+    return bool(session_id) and not session_id.translate(_SESSION_ID_CHARS_REMOVE)
 
 
 def _get_amplifier_home() -> str:
@@ -123,7 +148,7 @@ def _read_session_meta(session_dir: Path) -> dict[str, Any]:
             if (
                 isinstance(raw_parent, str)
                 and raw_parent
-                and _VALID_SESSION_ID_RE.fullmatch(raw_parent)
+                and is_valid_session_id(raw_parent)
             ):
                 parent_session_id = raw_parent
             raw_agent = metadata.get("agent_name")
@@ -145,36 +170,20 @@ def _read_session_meta(session_dir: Path) -> dict[str, Any]:
 
     last_updated, revision = _session_revision_signature(session_dir)
 
-    if transcript_path.exists():
+    summary = _read_summary_sidecar(session_dir, revision)
+    if summary is not None:
+        message_count, last_user_message = summary
+    elif transcript_path.exists():
         try:
-            with transcript_path.open(encoding="utf-8") as f:
-                for raw_line in f:
-                    line = raw_line.strip()
-                    if not line:
-                        continue
-                    try:
-                        entry = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-                    if not isinstance(entry, dict) or not entry.get("role"):
-                        continue
-                    message_count += 1
-                    if entry["role"] == "user":
-                        content = entry.get("content", "")
-                        if isinstance(content, str):
-                            last_user_message = content[:120]
-                        elif isinstance(content, list):
-                            for block in content:
-                                if (
-                                    isinstance(block, dict)
-                                    and block.get("type") == "text"
-                                ):
-                                    last_user_message = (block.get("text") or "")[:120]
-                                    break
+            message_count, last_user_message = _summarize_transcript(transcript_path)
         except OSError:
             logger.warning(
                 "Could not read transcript at %s", transcript_path, exc_info=True
             )
+        else:
+            _write_summary_sidecar(
+                session_dir, revision, message_count, last_user_message
+            )
 
     return {
         "session_id": session_dir.name,
@@ -190,6 +199,95 @@ def _read_session_meta(session_dir: Path) -> dict[str, Any]:
     }
 
 
+def _summarize_transcript(transcript_path: Path) -> tuple[int, str | None]:
+    """Return (message_count, last_user_message) for one transcript.jsonl.
+
+    Raises OSError if the transcript cannot be read.
+    """
+    message_count = 0
+    last_user_message: str | None = None
+    with transcript_path.open("rb") as f:
+        for line in f:
+            # Cheap substring pre-check: lines without a "role" key
+            # can never count as messages, so skip parsing them.
+            if b'"role"' not in line:
+                continue
+            try:
+                entry = _json_loads(line)
+            except ValueError:  # JSONDecodeError / bad UTF-8
+                continue
+            if not isinstance(entry, dict) or not entry.get("role"):
+                continue
+            message_count += 1
+            if entry["role"] == "user":
+                content = entry.get("content", "")
+                if isinstance(content, str):
+                    last_user_message = content[:120]
+                elif isinstance(content, list):
+                    for block in content:
+                        if isinstance(block, dict) and block.get("type") == "text":
+                            last_user_message = (block.get("text") or "")[:120]
+                            break
+    return message_count, last_user_message
+
+
+def _read_summary_sidecar(
+    session_dir: Path, revision: str
+) -> tuple[int, str | None] | None:
+    """Return the cached transcript summary if it matches *revision*, else None."""
+    try:
+        summary = json.loads(
+            (session_dir / SESSION_SUMMARY_FILENAME).read_text(encoding="utf-8")
+        )
+    except (OSError, ValueError):
+        return None
+    if not isinstance(summary, dict) or summary.get("revision") != revision:
+        return None
+    message_count = summary.get("message_count")
+    last_user_message = summary.get("last_user_message")
+    if not isinstance(message_count, int) or not (
+        last_user_message is None or isinstance(last_user_message, str)
+    ):
+        return None
+    return message_count, last_user_message
+
+
+def _write_summary_sidecar(
+    session_dir: Path,
+    revision: str,
+    message_count: int,
+    last_user_message: str | None,
+) -> None:
+    """Persist a transcript summary next to the transcript (best-effort)."""
+    summary = {
+        "revision": revision,
+        "message_count": message_count,
+        "last_user_message": last_user_message,
+    }
+    try:
+        atomic_write(session_dir / SESSION_SUMMARY_FILENAME, json.dumps(summary))
+    except OSError:
+        logger.debug("Could not write session summary in %s", session_dir)
+
+
+def write_session_summary(session_dir: Path) -> None:
+    """Regenerate the summary sidecar for *session_dir* from its transcript.
+
+    Called when a session ends so the next scan_sessions() can skip
+    re-reading the transcript.  No-op if there is no transcript yet.
+    """
+    transcript_path = session_dir / TRANSCRIPT_FILENAME
+    if not transcript_path.exists():
+        return
+    _, revision = _session_revision_signature(session_dir)
+    try:
+        message_count, last_user_message = _summarize_transcript(transcript_path)
+    except OSError:
+        logger.debug("Could not summarize transcript at %s", transcript_path)
+        return
+    _write_summary_sidecar(session_dir, revision, message_count, last_user_message)
+
+
 def _session_revision_signature(session_dir: Path) -> tuple[str, str]:
     """Return (last_updated_iso, revision_signature) for one session directory."""
     transcript_path = session_dir / TRANSCRIPT_FILENAME
@@ -227,9 +325,14 @@ def _iter_session_dirs(projects_path: Path) -> list[Path]:
 
     session_dirs: list[Path] = []
     for project_dir in project_dirs:
-        # Symlink containment — skip any project dir that escapes projects_path
+        # Symlink containment — skip any project dir that escapes projects_path.
+        # A plain directory entry can't escape, so only symlinks pay for the
+        # realpath() round-trip.
         try:
-            if project_dir.resolve().parent != resolved_projects:
+            if (
+                project_dir.is_symlink()
+                and project_dir.resolve().parent != resolved_projects
+            ):
                 logger.warning("Skipping symlink escape: %s", project_dir)
                 continue
         except OSError:
@@ -250,7 +353,10 @@ def _iter_session_dirs(projects_path: Path) -> list[Path]:
             candidates = [
                 d
                 for d in sessions_subdir.iterdir()
-                if d.is_dir() and d.resolve().is_relative_to(resolved_sessions)
+                if d.is_dir()
+                and (
+                    not d.is_symlink() or d.resolve().is_relative_to(resolved_sessions)
+                )
             ]
         except OSError:
             logger.warning(
@@ -259,7 +365,7 @@ def _iter_session_dirs(projects_path: Path) -> list[Path]:
             continue
 
         for session_dir in candidates:
-            if not _VALID_SESSION_ID_RE.fullmatch(session_dir.name):
+            if not is_valid_session_id(session_dir.name):
                 logger.debug(
                     "Skipping session dir with non-standard name: %r", session_dir.name
                 )
@@ -297,6 +403,28 @@ def scan_sessions(amplifier_home: str | None = None) -> list[dict[str, Any]]:
     return results
 
 
+def scan_sessions_cached(amplifier_home: str | None = None) -> list[dict[str, Any]]:
+    """Like scan_sessions(), but reuse a result younger than _SCAN_CACHE_TTL_S.
+
+    The returned list is shared between callers — do not mutate it.
+    """
+    global _scan_cache
+    home = amplifier_home or _get_amplifier_home()
+    now = time.monotonic()
+    cached = _scan_cache
+    if cached is not None and cached[1] == home and now - cached[0] < _SCAN_CACHE_TTL_S:
+        return cached[2]
+    results = scan_sessions(home)
+    _scan_cache = (now, home, results)
+    return results
+
+
+def invalidate_scan_cache() -> None:
+    """Drop the scan_sessions_cached() result (call on session create/end)."""
+    global _scan_cache
+    _scan_cache = None
+
+
 def scan_session_revisions(
     session_ids: set[str] | None = None,
     amplifier_home: str | None = None,
@@ -20,9 +20,12 @@ Routes:
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import logging
 import os
 import shutil
-import subprocess
+import time
+from collections.abc import Awaitable
 from pathlib import Path
 from typing import Any
 
@@ -33,22 +36,53 @@ from pydantic import BaseModel
 from amplifier_distro import distro_settings, overlay
 from amplifier_distro.features import (
     FEATURES,
-    PROVIDERS,
     get_provider_catalog,
     handle_provider_request,
     sync_providers,
 )
+from amplifier_distro.server import stub
 from amplifier_distro.server.app import AppManifest
 from amplifier_distro.server.apps.settings import (
+    _active_provider,
+    _any_provider_key,
+    _feature_includes_with_deps,
     _get_enabled_features,
+    _provider_env_status,
+    _readiness,
     detect_bridges,
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 steps_router = APIRouter(prefix="/steps")
 
 _static_dir = Path(__file__).parent / "static"
 
+# Cached contents of static/wizard.html; see wizard_page()
+_WIZARD_HTML: bytes | None = None
+
+# Static part of each GET /modules entry; only "enabled" varies per request.
+_MODULES_BASE: tuple[dict[str, Any], ...] = tuple(
+    {
+        "id": fid,
+        "name": feature.name,
+        "description": feature.description,
+        "tier": feature.tier,
+        "category": feature.category,
+        "default": feature.tier <= 1,
+        "requires": tuple(feature.requires),
+    }
+    for fid, feature in FEATURES.items()
+)
+
+# Canned /detect response served in stub mode; see detect_environment()
+_stub_detect_payload: dict[str, Any] | None = None
+
+# binary name -> (monotonic timestamp, shutil.which result); see _which_cached()
+_WHICH_TTL_S = 2.0
+_which_cache: dict[str, tuple[float, str | None]] = {}
+
 
 # --- Pydantic Models ---
 
@@ -73,10 +107,17 @@ class ProviderData(BaseModel):
 
 @router.get("/", response_class=HTMLResponse)
 async def wizard_page() -> HTMLResponse:
-    """Serve the setup wizard."""
-    html_file = _static_dir / "wizard.html"
-    if html_file.exists():
-        return HTMLResponse(content=html_file.read_text())
+    """Serve the setup wizard.
+
+    The page is static, so its bytes are read once and reused.
+    """
+    global _WIZARD_HTML
+    if _WIZARD_HTML is None:
+        html_file = _static_dir / "wizard.html"
+        if html_file.exists():
+            _WIZARD_HTML = html_file.read_bytes()
+    if _WIZARD_HTML is not None:
+        return HTMLResponse(content=_WIZARD_HTML)
     return HTMLResponse(
         content="<h1>Install Wizard</h1><p>wizard.html not found.</p>",
         status_code=500,
@@ -86,6 +127,99 @@ async def wizard_page() -> HTMLResponse:
 # --- API Routes ---
 
 
+async def _run_command(*args: str, timeout: float) -> str | None:
+    """Run a detection command without blocking the event loop.
+
+    Returns stripped stdout on exit code 0, else None (also when the
+    binary is missing or the command times out).
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except FileNotFoundError:
+        return None
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except TimeoutError:
+        with contextlib.suppress(ProcessLookupError):
+            proc.kill()
+        await proc.wait()
+        return None
+    if proc.returncode != 0:
+        return None
+    return stdout.decode().strip()
+
+
+async def _detect_gh() -> str | None:
+    """Return the GitHub login from the gh CLI, or None if unavailable."""
+    return await _run_command("gh", "api", "user", "--jq", ".login", timeout=10)
+
+
+async def _detect_git() -> str | None:
+    """Return the global git user.email, or None if unset/unavailable."""
+    email = await _run_command("git", "config", "--global", "user.email", timeout=5)
+    return email or None
+
+
+def _which_cached(name: str, ttl: float = _WHICH_TTL_S) -> str | None:
+    """shutil.which() memoized for *ttl* seconds per binary name.
+
+    One wizard flow asks about the same few binaries many times; each
+    lookup walks $PATH and stats every entry.
+    """
+    now = time.monotonic()
+    cached = _which_cache.get(name)
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+    path = shutil.which(name)
+    _which_cache[name] = (now, path)
+    return path
+
+
+async def _which_async(name: str) -> str | None:
+    """_which_cached() in a worker thread (PATH walk stats every entry)."""
+    return await asyncio.to_thread(_which_cached, name)
+
+
+async def _probe_tool(name: str, probe: Awaitable[str | None]) -> str | None:
+    """Await one tool probe, reporting an unexpected error as "not found".
+
+    detect_environment() gathers the probes concurrently; this keeps one
+    failing probe from hiding the results of the others.
+    """
+    try:
+        return await probe
+    except Exception:
+        logger.warning("Detecting %s failed", name, exc_info=True)
+        return None
+
+
+def _workspace_candidates() -> list[str]:
+    """Return common workspace directories that exist under the home dir.
+
+    One scandir of the home dir covers the top-level names (DirEntry.is_dir
+    only stats symlinks); ``dev/ANext`` costs one extra stat when ``dev``
+    exists.
+    """
+    home = Path.home()
+    try:
+        with os.scandir(home) as it:
+            dirs = {entry.name for entry in it if entry.is_dir()}
+    except OSError:
+        return []
+    candidates = []
+    for name in ["dev", "dev/ANext", "projects", "workspace", "code", "src"]:
+        if name == "dev/ANext":
+            if "dev" in dirs and (home / name).is_dir():
+                candidates.append(f"~/{name}")
+        elif name in dirs:
+            candidates.append(f"~/{name}")
+    return candidates
+
+
 @router.get("/detect")
 async def detect_environment() -> dict[str, Any]:
     """Auto-detect environment: GitHub, git, API keys, CLI/TUI, bundles.
@@ -93,80 +227,70 @@ async def detect_environment() -> dict[str, Any]:
     Returns both nested objects (backward compat) and flat convenience
     fields that the wizard JS reads directly.
     """
-    from amplifier_distro.server.stub import is_stub_mode, stub_detect_environment
-
-    if is_stub_mode():
-        return stub_detect_environment()
+    global _stub_detect_payload
+    if stub.is_stub_mode():
+        # Canned and constant — build it once per process.
+        if _stub_detect_payload is None:
+            _stub_detect_payload = stub.stub_detect_environment()
+        return _stub_detect_payload
 
     result: dict[str, Any] = {}
 
-    # Load existing distro settings for pre-fill
-    settings = distro_settings.load()
+    # All probes are independent — run them concurrently so the slowest one
+    # (gh, 10 s timeout) bounds the latency instead of the sum of all of them.
+    (
+        settings,  # existing distro settings for pre-fill
+        gh_handle,
+        git_email,
+        git_bin,
+        cli_bin,
+        tui_bin,
+        overlay_data,
+        candidates,
+        bridges,
+    ) = await asyncio.gather(
+        asyncio.to_thread(distro_settings.load),
+        _probe_tool("gh", _detect_gh()),
+        _probe_tool("git config", _detect_git()),
+        _probe_tool("git", _which_async("git")),
+        _probe_tool("amplifier", _which_async("amplifier")),
+        _probe_tool("amplifier-tui", _which_async("amplifier-tui")),
+        asyncio.to_thread(overlay.read_overlay),
+        asyncio.to_thread(_workspace_candidates),
+        asyncio.to_thread(detect_bridges),
+    )
 
     # GitHub
-    gh_handle: str | None = None
-    try:
-        proc = subprocess.run(
-            ["gh", "api", "user", "--jq", ".login"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if proc.returncode == 0:
-            gh_handle = proc.stdout.strip()
-            result["github"] = {"handle": gh_handle, "configured": True}
-        else:
-            result["github"] = {"handle": None, "configured": False}
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        result["github"] = {"handle": None, "configured": False}
+    result["github"] = {"handle": gh_handle, "configured": gh_handle is not None}
 
     # Git
-    git_installed = shutil.which("git") is not None
-    git_configured = False
-    git_email: str | None = None
-    if git_installed:
-        try:
-            proc = subprocess.run(
-                ["git", "config", "--global", "user.email"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if proc.returncode == 0 and proc.stdout.strip():
-                git_configured = True
-                git_email = proc.stdout.strip()
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
+    git_installed = git_bin is not None
+    if not git_installed:
+        git_email = None
     result["git"] = {
         "installed": git_installed,
-        "configured": git_configured,
+        "configured": git_email is not None,
         "email": git_email,
     }
 
     # API keys (check env)
-    result["api_keys"] = {
-        pid: bool(os.environ.get(p.env_var)) for pid, p in PROVIDERS.items()
-    }
+    env_status = _provider_env_status()
+    result["api_keys"] = env_status
 
     # Amplifier CLI & TUI
-    cli_installed = shutil.which("amplifier") is not None
+    cli_installed = cli_bin is not None
+    tui_installed = tui_bin is not None
     result["amplifier_cli"] = {"installed": cli_installed}
-    result["tui_installed"] = shutil.which("amplifier-tui") is not None
+    result["tui_installed"] = tui_installed
 
     # Overlay bundle
-    result["overlay_bundle"] = overlay.read_overlay() or None
+    result["overlay_bundle"] = overlay_data or None
 
     # Workspace candidates
-    home = Path.home()
-    candidates = []
-    for name in ["dev", "dev/ANext", "projects", "workspace", "code", "src"]:
-        p = home / name
-        if p.exists() and p.is_dir():
-            candidates.append(f"~/{name}")
     result["workspace_candidates"] = candidates
 
     # Bridges (Slack, Voice)
-    result["bridges"] = detect_bridges()
+    result["bridges"] = bridges
 
     # --- Flat convenience fields (settings win, then detection, then None) ---
 
@@ -184,20 +308,14 @@ async def detect_environment() -> dict[str, Any]:
     result["git_email"] = settings.identity.git_email or git_email or ""
 
     # Active provider: which provider has a key in env
-    result["provider"] = None
-    for pid, p in PROVIDERS.items():
-        if os.environ.get(p.env_var):
-            result["provider"] = pid
-            break
+    result["provider"] = _active_provider(env_status)
 
     # has_api_key: any provider key present
-    result["has_api_key"] = any(
-        bool(os.environ.get(p.env_var)) for p in PROVIDERS.values()
-    )
+    result["has_api_key"] = _any_provider_key(env_status)
 
     # cli/tui installed flat aliases
     result["cli_installed"] = cli_installed
-    result["tui_installed"] = shutil.which("amplifier-tui") is not None
+    result["tui_installed"] = tui_installed
 
     return result
 
@@ -206,22 +324,12 @@ async def detect_environment() -> dict[str, Any]:
 async def get_modules() -> dict[str, Any]:
     """Return the feature/module catalog with current enabled state."""
     currently_enabled = set(_get_enabled_features())
-
-    modules = [
-        {
-            "id": fid,
-            "name": feature.name,
-            "description": feature.description,
-            "tier": feature.tier,
-            "category": feature.category,
-            "default": feature.tier <= 1,
-            "enabled": fid in currently_enabled,
-            "requires": feature.requires,
-        }
-        for fid, feature in FEATURES.items()
-    ]
-
-    return {"modules": modules}
+    return {
+        "modules": [
+            {**base, "enabled": base["id"] in currently_enabled}
+            for base in _MODULES_BASE
+        ]
+    }
 
 
 @router.get("/providers")
@@ -258,18 +366,16 @@ async def step_config(request: Request) -> dict[str, Any]:
 async def step_modules(req: ModulesData) -> dict[str, Any]:
     """Toggle features in the overlay bundle based on selected module IDs."""
     requested = set(req.modules)
+    to_add: list[str] = []
+    to_remove: list[str] = []
     for fid, feature in FEATURES.items():
         if fid in requested:
-            # Enable: add dependencies first, then feature includes
-            for dep_id in feature.requires:
-                dep = FEATURES[dep_id]
-                for inc in dep.includes:
-                    overlay.add_include(inc)
-            for inc in feature.includes:
-                overlay.add_include(inc)
+            to_add.extend(_feature_includes_with_deps(fid))
         else:
-            for inc in feature.includes:
-                overlay.remove_include(inc)
+            to_remove.extend(feature.includes)
+    # Adds win over removes, so a dependency of a requested feature stays
+    # included even when it was not itself selected.
+    overlay.update_includes(add=to_add, remove=to_remove)
     return {"status": "ok", "enabled": req.modules}
 
 
@@ -286,7 +392,7 @@ _TOOLS: dict[str, tuple[str, str]] = {
 
 async def _uv_tool_install(binary: str, package_url: str) -> dict[str, Any]:
     """Install a tool via ``uv tool install``, return status dict."""
-    if shutil.which(binary) is not None:
+    if _which_cached(binary) is not None:
         return {"status": "ok", "installed": True}
     try:
         proc = await asyncio.create_subprocess_exec(
@@ -307,7 +413,9 @@ async def _uv_tool_install(binary: str, package_url: str) -> dict[str, Any]:
             "detail": "uv is not installed. Install it first: https://docs.astral.sh/uv/",
             "installed": False,
         }
-    return {"status": "ok", "installed": shutil.which(binary) is not None}
+    # Drop the cached miss so the freshly installed binary is found
+    _which_cache.pop(binary, None)
+    return {"status": "ok", "installed": _which_cached(binary) is not None}
 
 
 @steps_router.post("/interfaces")
@@ -315,16 +423,20 @@ async def step_interfaces(req: InterfacesData) -> dict[str, Any]:
     """Handle interfaces step, optionally installing the CLI and/or TUI."""
     result: dict[str, Any] = {"status": "ok"}
 
-    for flag, key in [("install_cli", "cli"), ("install_tui", "tui")]:
-        if getattr(req, flag):
-            binary, url = _TOOLS[key]
-            res = await _uv_tool_install(binary, url)
-            if res["status"] == "error":
-                result["status"] = "error"
-                result[f"{key}_error"] = res["detail"]
-
-    result["cli_installed"] = shutil.which("amplifier") is not None
-    result["tui_installed"] = shutil.which("amplifier-tui") is not None
+    # Each install is network-bound; run the requested ones concurrently
+    keys = [
+        key
+        for flag, key in [("install_cli", "cli"), ("install_tui", "tui")]
+        if getattr(req, flag)
+    ]
+    installs = await asyncio.gather(*(_uv_tool_install(*_TOOLS[key]) for key in keys))
+    for key, res in zip(keys, installs, strict=True):
+        if res["status"] == "error":
+            result["status"] = "error"
+            result[f"{key}_error"] = res["detail"]
+
+    result["cli_installed"] = _which_cached("amplifier") is not None
+    result["tui_installed"] = _which_cached("amplifier-tui") is not None
     return result
 
 
@@ -361,9 +473,7 @@ async def step_provider(req: ProviderData) -> dict[str, Any]:
 @steps_router.post("/verify")
 async def step_verify(request: Request) -> dict[str, Any]:
     """Final verification step - check overall readiness."""
-    from amplifier_distro.server.apps.settings import compute_phase
-
-    phase = compute_phase()
+    phase, overlay_ok, has_key = _readiness()
     settings = distro_settings.load()
 
     return {
@@ -372,10 +482,10 @@ async def step_verify(request: Request) -> dict[str, Any]:
         "ready": phase == "ready",
         "workspace_root": settings.workspace_root,
         "github_handle": settings.identity.github_handle,
-        "has_api_key": any(bool(os.environ.get(p.env_var)) for p in PROVIDERS.values()),
-        "cli_installed": shutil.which("amplifier") is not None,
-        "tui_installed": shutil.which("amplifier-tui") is not None,
-        "overlay_exists": overlay.overlay_exists(),
+        "has_api_key": has_key,
+        "cli_installed": _which_cached("amplifier") is not None,
+        "tui_installed": _which_cached("amplifier-tui") is not None,
+        "overlay_exists": overlay_ok,
     }
 
 
@@ -16,7 +16,10 @@ Routes:
 from __future__ import annotations
 
 import contextlib
+import copy
 import os
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
@@ -34,12 +37,21 @@ from amplifier_distro.conventions import (
 from amplifier_distro.features import (
     FEATURES,
     PROVIDERS,
+    features_for_tier,
     get_provider_catalog,
     handle_provider_request,
     provider_bundle_uri,
 )
+from amplifier_distro.fileutil import read_env_file
 from amplifier_distro.server.app import AppManifest
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 # Bridge env-var / keys.env lookups used by detect_bridges()
 _BRIDGE_DEFS: dict[str, dict[str, Any]] = {
     "slack": {
@@ -58,10 +70,47 @@ _BRIDGE_DEFS: dict[str, dict[str, Any]] = {
     },
 }
 
+# Static lookup tables for the per-request env scans: (provider ID, env var)
+# pairs in catalog order (env vars need not be unique), and each bridge's
+# required keys.
+_PROVIDER_ENV_VARS: tuple[tuple[str, str], ...] = tuple(
+    (pid, p.env_var) for pid, p in PROVIDERS.items()
+)
+_BRIDGE_REQUIRED: tuple[tuple[str, tuple[str, ...]], ...] = tuple(
+    (bid, tuple(defn["required_keys"])) for bid, defn in _BRIDGE_DEFS.items()
+)
+
+# Feature lookups built once from the static catalog: each feature's include
+# set, and an inverted index from include URI to the features that use it.
+_FEATURE_INCLUDES: dict[str, frozenset[str]] = {
+    fid: frozenset(f.includes) for fid, f in FEATURES.items()
+}
+
+
+def _build_include_index() -> dict[str, frozenset[str]]:
+    index: dict[str, set[str]] = {}
+    for fid, includes in _FEATURE_INCLUDES.items():
+        for uri in includes:
+            index.setdefault(uri, set()).add(fid)
+    return {uri: frozenset(fids) for uri, fids in index.items()}
+
+
+_INCLUDE_TO_FEATURES = _build_include_index()
+# Features without includes are trivially enabled and never hit the index.
+_ALWAYS_CANDIDATES = frozenset(
+    fid for fid, incs in _FEATURE_INCLUDES.items() if not incs
+)
+
 router = APIRouter()
 
 _static_dir = Path(__file__).parent / "static"
 
+# Cached contents of static/settings.html; see settings_page()
+_SETTINGS_HTML: bytes | None = None
+
+# (settings.yaml path, st_mtime_ns, st_size, parsed tree); see _load_settings()
+_settings_cache: tuple[Path, int, int, dict[str, Any]] | None = None
+
 
 # --- Pydantic Models ---
 
@@ -95,23 +144,97 @@ def _keys_path() -> Path:
     return _amplifier_home() / KEYS_FILENAME
 
 
-def _has_any_provider_key() -> bool:
+def _provider_env_status() -> dict[str, bool]:
+    """Map each provider ID to whether its API key env var is set.
+
+    Build this once per request and pass it around rather than re-reading
+    ``os.environ`` for every provider in every helper.
+    """
+    environ = os.environ
+    return {pid: bool(environ.get(env)) for pid, env in _PROVIDER_ENV_VARS}
+
+
+def _any_provider_key(env_status: dict[str, bool]) -> bool:
+    """True if any provider in *env_status* has its key set."""
+    return any(env_status.values())
+
+
+def _active_provider(env_status: dict[str, bool]) -> str | None:
+    """Return the first provider ID (catalog order) with its key set."""
+    return next((pid for pid, has_key in env_status.items() if has_key), None)
+
+
+def _has_any_provider_key(env_status: dict[str, bool] | None = None) -> bool:
     """Check if any provider API key is available in environment."""
-    return any(bool(os.environ.get(p.env_var)) for p in PROVIDERS.values())
+    if env_status is None:
+        # Stop at the first key found rather than building the full map.
+        return any(os.environ.get(env) for _, env in _PROVIDER_ENV_VARS)
+    return _any_provider_key(env_status)
+
+
+@dataclass(frozen=True)
+class _State:
+    """One read of everything the status helpers look at.
+
+    Built by ``_snapshot_state()`` and passed as ``state=`` so a request
+    reads the overlay, keys.env and provider env vars once, and every
+    helper answers from the same consistent view.
+    """
+
+    includes: frozenset[str]
+    overlay_exists: bool
+    env_status: dict[str, bool]
+    keys: Mapping[str, str]
+
+
+def _snapshot_state() -> _State:
+    return _State(
+        includes=frozenset(overlay.get_includes()),
+        overlay_exists=overlay.overlay_exists(),
+        env_status=_provider_env_status(),
+        keys=load_keys(),
+    )
+
+
+def _current_includes(state: _State | None) -> frozenset[str]:
+    if state is not None:
+        return state.includes
+    return frozenset(overlay.get_includes())
+
 
+def _readiness(
+    env_status: dict[str, bool] | None = None,
+    state: _State | None = None,
+) -> tuple[str, bool, bool]:
+    """Return ``(phase, overlay_exists, has_provider_key)`` in one pass.
 
-def compute_phase() -> str:
+    Callers that need more than the phase (e.g. the wizard's verify step)
+    use this instead of re-checking the overlay and provider keys.
+    """
+    if state is not None:
+        overlay_ok = state.overlay_exists
+        env_status = state.env_status
+    else:
+        overlay_ok = overlay.overlay_exists()
+    has_key = _has_any_provider_key(env_status)
+    phase = "ready" if overlay_ok and has_key else "unconfigured"
+    return phase, overlay_ok, has_key
+
+
+def compute_phase(
+    env_status: dict[str, bool] | None = None,
+    state: _State | None = None,
+) -> str:
     """Compute current setup phase.
 
+    Pass *env_status* (from ``_provider_env_status()``) or *state* (from
+    ``_snapshot_state()``) to reuse reads the caller already did.
+
     Returns:
         "unconfigured" - no overlay bundle OR no provider key in env
         "ready"        - overlay bundle exists AND at least one provider key
     """
-    if not overlay.overlay_exists():
-        return "unconfigured"
-    if not _has_any_provider_key():
-        return "unconfigured"
-    return "ready"
+    return _readiness(env_status, state)[0]
 
 
 def persist_api_key(provider_id: str, api_key: str) -> None:
@@ -126,25 +249,28 @@ def persist_api_key(provider_id: str, api_key: str) -> None:
     keys_path.parent.mkdir(parents=True, exist_ok=True)
 
     key_name = provider.env_var
+    key_bytes = key_name.encode()
+    new_line = f'{key_name}="{api_key}"'.encode()
 
-    # Read existing lines, update or append
-    lines: list[str] = []
+    # Read existing lines, update or append. Lines stay as bytes so comments
+    # and other keys are written back without a decode/encode round trip.
+    lines: list[bytes] = []
     found = False
     if keys_path.exists():
-        for raw_line in keys_path.read_text().splitlines():
+        for raw_line in keys_path.read_bytes().splitlines():
             stripped = raw_line.strip()
-            if stripped and not stripped.startswith("#") and "=" in stripped:
-                existing_key, _, _ = stripped.partition("=")
-                if existing_key.strip() == key_name:
-                    lines.append(f'{key_name}="{api_key}"')
+            if stripped and stripped[:1] != b"#" and b"=" in stripped:
+                existing_key, _, _ = stripped.partition(b"=")
+                if existing_key.strip() == key_bytes:
+                    lines.append(new_line)
                     found = True
                     continue
             lines.append(raw_line)
 
     if not found:
-        lines.append(f'{key_name}="{api_key}"')
+        lines.append(new_line)
 
-    keys_path.write_text("\n".join(lines) + "\n")
+    keys_path.write_bytes(b"\n".join(lines) + b"\n")
     with contextlib.suppress(OSError):
         keys_path.chmod(0o600)  # Windows may not support this
 
@@ -163,9 +289,7 @@ def add_provider_config(provider_id: str) -> None:
     settings_path = _settings_path()
     settings_path.parent.mkdir(parents=True, exist_ok=True)
 
-    settings: dict = {}
-    if settings_path.exists():
-        settings = yaml.safe_load(settings_path.read_text()) or {}
+    settings = _load_settings(settings_path)
 
     config = settings.setdefault("config", {})
     providers_list: list[dict] = config.setdefault("providers", [])
@@ -195,88 +319,132 @@ def add_provider_config(provider_id: str) -> None:
 
     providers_list.append(new_entry)
 
+    _save_settings(settings_path, settings)
+
+
+def _load_settings(settings_path: Path) -> dict[str, Any]:
+    """Return a private copy of the parsed settings.yaml ({} if missing).
+
+    The parsed tree is cached in memory until the file's mtime or size
+    changes.
+    """
+    global _settings_cache
+    try:
+        st = settings_path.stat()
+    except OSError:
+        return {}
+    cached = _settings_cache
+    if (
+        cached is not None
+        and cached[0] == settings_path
+        and cached[1] == st.st_mtime_ns
+        and cached[2] == st.st_size
+    ):
+        return copy.deepcopy(cached[3])
+    settings = yaml.load(settings_path.read_bytes(), Loader=_YamlLoader) or {}
+    _settings_cache = (settings_path, st.st_mtime_ns, st.st_size, settings)
+    return copy.deepcopy(settings)
+
+
+def load_settings() -> dict[str, Any]:
+    """Load settings.yaml if it exists, returning a private copy of the tree.
+
+    Shares the parse cache used by the settings routes; raises
+    ``yaml.YAMLError`` if the file is malformed.
+    """
+    return _load_settings(_settings_path())
+
+
+def _save_settings(settings_path: Path, settings: dict[str, Any]) -> None:
+    """Write settings.yaml and prime the cache with what was written."""
+    global _settings_cache
     settings_path.write_text(
-        yaml.dump(settings, default_flow_style=False, sort_keys=False)
+        yaml.dump(
+            settings, default_flow_style=False, sort_keys=False, Dumper=_YamlDumper
+        )
+    )
+    st = settings_path.stat()
+    _settings_cache = (
+        settings_path,
+        st.st_mtime_ns,
+        st.st_size,
+        copy.deepcopy(settings),
     )
 
 
 def load_keys() -> dict[str, str]:
-    """Load keys.env if it exists, returning a dict of key=value pairs."""
-    keys_path = _keys_path()
-    if not keys_path.exists():
-        return {}
-    result: dict[str, str] = {}
+    """Load keys.env if it exists, returning a dict of key=value pairs.
+
+    Parsing is cached by ``read_env_file()`` until the file's mtime or size
+    changes, so repeated status/detect requests don't re-parse it.
+    """
     try:
-        for raw_line in keys_path.read_text().splitlines():
-            line = raw_line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" not in line:
-                continue
-            key, _, value = line.partition("=")
-            key = key.strip()
-            value = value.strip()
-            if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
-                value = value[1:-1]
-            if key:
-                result[key] = value
+        return read_env_file(_keys_path())
     except OSError:
-        pass
-    return result
+        return {}
 
 
-def detect_bridges() -> dict[str, Any]:
+def detect_bridges(state: _State | None = None) -> dict[str, Any]:
     """Detect configuration status of all known bridges.
 
     Checks env vars first, then keys.env.
     """
-    keys = load_keys()
+    keys = state.keys if state is not None else load_keys()
+    environ = os.environ
     bridges: dict[str, Any] = {}
 
-    for bid, defn in _BRIDGE_DEFS.items():
-        present: list[str] = []
-        missing: list[str] = []
-        for k in defn["required_keys"]:
-            if os.environ.get(k) or keys.get(k):
-                present.append(k)
-            else:
-                missing.append(k)
-
-        configured = len(missing) == 0
+    for bid, required in _BRIDGE_REQUIRED:
+        missing = [k for k in required if not (environ.get(k) or keys.get(k))]
+        defn = _BRIDGE_DEFS[bid]
         bridges[bid] = {
             "name": defn["name"],
             "description": defn["description"],
-            "configured": configured,
+            "configured": not missing,
             "missing_keys": missing,
             "setup_url": defn["setup_url"],
         }
     return bridges
 
 
-def _get_enabled_features() -> list[str]:
+def _get_enabled_features(state: _State | None = None) -> list[str]:
     """Return IDs of features currently included in the overlay bundle."""
-    current_uris = set(overlay.get_includes())
-    enabled = []
-    for fid, feature in FEATURES.items():
-        if all(inc in current_uris for inc in feature.includes):
-            enabled.append(fid)
-    return enabled
+    current_uris = _current_includes(state)
+    candidates = _ALWAYS_CANDIDATES.union(
+        *(_INCLUDE_TO_FEATURES.get(uri, ()) for uri in current_uris)
+    )
+    return [
+        fid
+        for fid in FEATURES
+        if fid in candidates and _FEATURE_INCLUDES[fid] <= current_uris
+    ]
+
+
+def _feature_includes_with_deps(feature_id: str) -> list[str]:
+    """Include URIs needed to enable a feature, dependencies first."""
+    feature = FEATURES[feature_id]
+    uris: list[str] = []
+    for dep_id in feature.requires:
+        uris.extend(FEATURES[dep_id].includes)
+    uris.extend(feature.includes)
+    return uris
 
 
-def _get_current_provider() -> str | None:
+def _get_current_provider(state: _State | None = None) -> str | None:
     """Return the current provider ID from the overlay, or None."""
-    current_uris = set(overlay.get_includes())
+    current_uris = _current_includes(state)
     for pid, provider in PROVIDERS.items():
         if provider_bundle_uri(provider) in current_uris:
             return pid
     return None
 
 
-def _build_status() -> dict[str, Any]:
+def _build_status(state: _State | None = None) -> dict[str, Any]:
     """Build the full status response."""
-    phase = compute_phase()
-    provider = _get_current_provider()
-    enabled = set(_get_enabled_features())
+    if state is None:
+        state = _snapshot_state()
+    phase = compute_phase(state=state)
+    provider = _get_current_provider(state)
+    enabled = set(_get_enabled_features(state))
 
     features: dict[str, Any] = {}
     for fid, feature in FEATURES.items():
@@ -291,7 +459,7 @@ def _build_status() -> dict[str, Any]:
         "phase": phase,
         "provider": provider,
         "features": features,
-        "bridges": detect_bridges(),
+        "bridges": detect_bridges(state),
     }
 
 
@@ -300,10 +468,14 @@ def _build_status() -> dict[str, Any]:
 
 @router.get("/", response_class=HTMLResponse)
 async def settings_page() -> HTMLResponse:
-    """Serve the settings dashboard."""
-    html_file = _static_dir / "settings.html"
-    if html_file.exists():
-        return HTMLResponse(content=html_file.read_text())
+    """Serve the settings dashboard (read from disk on first request only)."""
+    global _SETTINGS_HTML
+    if _SETTINGS_HTML is None:
+        html_file = _static_dir / "settings.html"
+        if html_file.exists():
+            _SETTINGS_HTML = html_file.read_bytes()
+    if _SETTINGS_HTML is not None:
+        return HTMLResponse(content=_SETTINGS_HTML)
     return HTMLResponse(
         content="<h1>Settings</h1><p>settings.html not found.</p>",
         status_code=500,
@@ -327,39 +499,42 @@ async def toggle_feature(req: FeatureToggle) -> dict[str, Any]:
             status_code=400, detail=f"Unknown feature: {req.feature_id}"
         )
 
-    feature = FEATURES[req.feature_id]
+    state = _snapshot_state()
+    current_uris = state.includes
     if req.enabled:
-        # Add dependencies first
-        for req_id in feature.requires:
-            dep = FEATURES[req_id]
-            for inc in dep.includes:
-                overlay.add_include(inc)
-        for inc in feature.includes:
-            overlay.add_include(inc)
+        to_add = [
+            uri
+            for uri in _feature_includes_with_deps(req.feature_id)
+            if uri not in current_uris
+        ]
+        to_remove: list[str] = []
     else:
-        for inc in feature.includes:
-            overlay.remove_include(inc)
-
+        to_add = []
+        to_remove = [
+            uri for uri in FEATURES[req.feature_id].includes if uri in current_uris
+        ]
+    if not to_add and not to_remove:
+        return _build_status(state)  # Already in the requested state
+
+    overlay.update_includes(add=to_add, remove=to_remove)
     return _build_status()
 
 
 @router.post("/tier")
 async def set_tier(req: TierRequest) -> dict[str, Any]:
     """Set feature tier level."""
-    from amplifier_distro.features import features_for_tier
-
-    needed = features_for_tier(req.tier)
-    current = set(_get_enabled_features())
-    for fid in needed:
+    state = _snapshot_state()
+    current_uris = state.includes
+    current = set(_get_enabled_features(state))
+    to_add: list[str] = []
+    for fid in features_for_tier(req.tier):
         if fid not in current:
-            feature = FEATURES[fid]
-            for dep_id in feature.requires:
-                dep = FEATURES[dep_id]
-                for inc in dep.includes:
-                    overlay.add_include(inc)
-            for inc in feature.includes:
-                overlay.add_include(inc)
+            to_add.extend(_feature_includes_with_deps(fid))
+    to_add = [uri for uri in to_add if uri not in current_uris]
+    if not to_add:
+        return _build_status(state)  # Tier already satisfied
 
+    overlay.update_includes(add=to_add)
     return _build_status()
 
 
@@ -407,8 +582,6 @@ class DistroSettingsUpdate(BaseModel):
 @router.get("/distro-settings")
 async def get_distro_settings() -> dict[str, Any]:
     """Read all distro settings."""
-    from dataclasses import asdict
-
     settings = distro_settings.load()
     return {"settings": asdict(settings), "path": str(distro_settings._settings_path())}
 
@@ -416,8 +589,6 @@ async def get_distro_settings() -> dict[str, Any]:
 @router.post("/distro-settings")
 async def update_distro_settings(req: DistroSettingsUpdate) -> dict[str, Any]:
     """Update distro settings (partial merge)."""
-    from dataclasses import asdict
-
     if req.workspace_root is not None:
         distro_settings.update(workspace_root=req.workspace_root)
     for section_name in ("identity", "backup", "slack", "voice", "watchdog"):
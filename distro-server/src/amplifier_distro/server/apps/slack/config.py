@@ -10,72 +10,125 @@ Priority order (highest wins):
 
 from __future__ import annotations
 
+import dataclasses
+import functools
 import logging
 import os
+from collections.abc import Collection, Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from amplifier_distro.conventions import AMPLIFIER_HOME, KEYS_FILENAME
+from amplifier_distro.fileutil import read_env_file
 
 logger = logging.getLogger(__name__)
 
 
+# Secrets that may come from keys.env (env vars take precedence).
+_SECRET_KEYS: tuple[str, ...] = (
+    "SLACK_BOT_TOKEN",
+    "SLACK_APP_TOKEN",
+    "SLACK_SIGNING_SECRET",
+)
+
+# Every env var from_env() reads; part of the from_env() cache key.
+_TRACKED_ENV_KEYS: tuple[str, ...] = (
+    *_SECRET_KEYS,
+    "SLACK_HUB_CHANNEL_ID",
+    "SLACK_HUB_CHANNEL_NAME",
+    "SLACK_DEFAULT_WORKING_DIR",
+    "SLACK_SIMULATOR_MODE",
+    "SLACK_SOCKET_MODE",
+)
+
+# Env values _env_bool() treats as true (compared lowercased).
+_TRUE_VALUES = frozenset({"1", "true", "yes"})
+
+# (cache key, config) from the last from_env() build; see _from_env_key().
+_cached_config: tuple[tuple[Any, ...], SlackConfig] | None = None
+
+
+@functools.lru_cache(maxsize=1)
 def _amplifier_home() -> Path:
+    # Resolved once: expanduser() re-reads HOME on every call.
     return Path(AMPLIFIER_HOME).expanduser()
 
 
-def _load_keys() -> dict[str, Any]:
-    """Load ~/.amplifier/keys.env if it exists (.env format)."""
-    path = _amplifier_home() / KEYS_FILENAME
-    if not path.exists():
-        return {}
-    result: dict[str, Any] = {}
+def _load_keys(needed: Collection[str] | None = None) -> dict[str, Any]:
+    """Load ~/.amplifier/keys.env if it exists (.env format).
+
+    With *needed*, only those keys are returned; keys.env is shared with
+    other providers and may hold many unrelated entries.
+    """
     try:
-        for raw_line in path.read_text().splitlines():
-            line = raw_line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" not in line:
-                continue
-            key, _, value = line.partition("=")
-            key = key.strip()
-            value = value.strip()
-            if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
-                value = value[1:-1]
-            if key:
-                result[key] = value
+        keys = read_env_file(_amplifier_home() / KEYS_FILENAME)
     except OSError:
         logger.warning("Failed to read keys.env", exc_info=True)
-    return result
+        return {}
+    if needed is None:
+        return keys
+    return {key: value for key, value in keys.items() if key in needed}
+
+
+def _env_snapshot() -> dict[str, str]:
+    """Read every tracked SLACK_* env var once ("" when unset)."""
+    environ = os.environ
+    return {k: environ.get(k, "") for k in _TRACKED_ENV_KEYS}
 
 
-def _env_str(env_key: str, fallback: str) -> str:
+def _env_str(env: Mapping[str, str], env_key: str, fallback: str) -> str:
     """Return env var if set, else fallback."""
-    val = os.environ.get(env_key, "")
+    val = env.get(env_key, "")
     return val if val else fallback
 
 
-def _env_bool(env_key: str, fallback: bool) -> bool:
+def _env_bool(env: Mapping[str, str], env_key: str, fallback: bool) -> bool:
     """Return env var as bool if set, else fallback."""
-    val = os.environ.get(env_key, "")
-    if val:
-        return val.lower() in ("1", "true", "yes")
-    return fallback
+    val = env.get(env_key, "")
+    if not val:
+        return fallback
+    if len(val) == 1:  # "1"/"0", the common case; no lowercased copy needed
+        return val == "1"
+    return val.lower() in _TRUE_VALUES
 
 
-def _key_str(env_key: str, keys: dict[str, Any]) -> str:
+def _key_str(env: Mapping[str, str], env_key: str, keys: dict[str, Any]) -> str:
     """Return env var > keys.env value, or empty string."""
-    val = os.environ.get(env_key, "")
+    val = env.get(env_key, "")
     if val:
         return val
     k = keys.get(env_key, "")
     return str(k) if k else ""
 
 
-@dataclass
+def _file_signature(path: Path) -> tuple[Any, ...]:
+    """(path, mtime_ns, size) for an existing file, else just (path,)."""
+    try:
+        st = path.stat()
+    except OSError:
+        return (str(path),)
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+def _from_env_key(env: Mapping[str, str]) -> tuple[Any, ...]:
+    """Everything SlackConfig.from_env() depends on, cheaply comparable."""
+    from amplifier_distro import distro_settings
+
+    return (
+        _file_signature(_amplifier_home() / KEYS_FILENAME),
+        _file_signature(distro_settings._settings_path()),
+        tuple(env.values()),
+    )
+
+
+@dataclass(slots=True)
 class SlackConfig:
-    """Slack bridge configuration."""
+    """Slack bridge configuration.
+
+    Slotted to keep instances small. Not frozen: initialize() flips
+    ``simulator_mode`` on the config it was given.
+    """
 
     # --- Slack API Credentials (from keys.env) ---
     bot_token: str = ""  # xoxb-... (Bot User OAuth Token)
@@ -105,28 +158,58 @@ class SlackConfig:
     socket_mode: bool = False
 
     @classmethod
-    def from_env(cls) -> SlackConfig:
+    def from_env(cls, reset_cache: bool = False) -> SlackConfig:
         """Load config from keys.env + distro settings + env overrides.
 
         Priority: env vars > keys.env (secrets) > distro settings (config)
         > dataclass defaults.
+
+        The result is memoized until keys.env, the distro settings file or
+        one of the tracked ``SLACK_*`` env vars changes; pass
+        ``reset_cache=True`` to force a rebuild. Each call returns its own
+        copy, so callers may adjust fields freely.
+        """
+        global _cached_config
+        env = _env_snapshot()
+        key = _from_env_key(env)
+        cached = _cached_config
+        if reset_cache or cached is None or cached[0] != key:
+            cached = (key, cls._calculate_from_env(env))
+            _cached_config = cached
+        return dataclasses.replace(cached[1])
+
+    @classmethod
+    def _calculate_from_env(cls, env: Mapping[str, str] | None = None) -> SlackConfig:
+        """Build a config from the current sources (uncached from_env).
+
+        *env* is a ``_env_snapshot()``; taken fresh when omitted.
         """
         from amplifier_distro import distro_settings
 
-        keys = _load_keys()
+        if env is None:
+            env = _env_snapshot()
+
+        # keys.env only supplies secrets; skip reading it when the env
+        # already provides all of them (the usual containerized setup).
+        if all(env.get(k) for k in _SECRET_KEYS):
+            keys: dict[str, Any] = {}
+        else:
+            keys = _load_keys(needed=_SECRET_KEYS)
         ds = distro_settings.load().slack
 
         config = cls(
-            bot_token=_key_str("SLACK_BOT_TOKEN", keys),
-            app_token=_key_str("SLACK_APP_TOKEN", keys),
-            signing_secret=_key_str("SLACK_SIGNING_SECRET", keys),
-            hub_channel_id=_env_str("SLACK_HUB_CHANNEL_ID", ds.hub_channel_id),
-            hub_channel_name=_env_str("SLACK_HUB_CHANNEL_NAME", ds.hub_channel_name),
+            bot_token=_key_str(env, "SLACK_BOT_TOKEN", keys),
+            app_token=_key_str(env, "SLACK_APP_TOKEN", keys),
+            signing_secret=_key_str(env, "SLACK_SIGNING_SECRET", keys),
+            hub_channel_id=_env_str(env, "SLACK_HUB_CHANNEL_ID", ds.hub_channel_id),
+            hub_channel_name=_env_str(
+                env, "SLACK_HUB_CHANNEL_NAME", ds.hub_channel_name
+            ),
             default_working_dir=_env_str(
-                "SLACK_DEFAULT_WORKING_DIR", ds.default_working_dir
+                env, "SLACK_DEFAULT_WORKING_DIR", ds.default_working_dir
             ),
-            simulator_mode=_env_bool("SLACK_SIMULATOR_MODE", ds.simulator_mode),
-            socket_mode=_env_bool("SLACK_SOCKET_MODE", ds.socket_mode),
+            simulator_mode=_env_bool(env, "SLACK_SIMULATOR_MODE", ds.simulator_mode),
+            socket_mode=_env_bool(env, "SLACK_SOCKET_MODE", ds.socket_mode),
             # These come directly from distro settings (no env override)
             thread_per_session=ds.thread_per_session,
             allow_breakout=ds.allow_breakout,
@@ -154,8 +237,7 @@ class SlackConfig:
         """Current operating mode."""
         if self.simulator_mode:
             return "simulator"
-        if self.socket_mode and self.bot_token and self.app_token:
-            return "socket"
+        # is_configured already checks the tokens the transport needs.
         if self.is_configured:
-            return "events-api"
+            return "socket" if self.socket_mode else "events-api"
         return "unconfigured"
@@ -75,7 +75,7 @@ _repo_override: Any = None
 # Session ID validation
 # ---------------------------------------------------------------------------
 
-_VALID_SESSION_ID = re.compile(r"^[a-zA-Z0-9_\-]+$")
+_VALID_SESSION_ID = re.compile(r"\A[a-zA-Z0-9_\-]+\Z")
 
 # ---------------------------------------------------------------------------
 # Internal helpers
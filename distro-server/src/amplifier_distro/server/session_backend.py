@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import inspect
 import json
 import logging
 import os
@@ -81,18 +82,15 @@ class _SessionHandle:
 
     async def cancel(self, level: str = "graceful") -> None:
         """Request cancellation of the running session."""
-        if self.session is None:
-            return
+        # getattr(None, ...) falls through to the default, so a missing
+        # session or coordinator both end up as request_cancel=None.
         coordinator = getattr(self.session, "coordinator", None)
-        if coordinator is None:
-            return
         request_cancel = getattr(coordinator, "request_cancel", None)
         if request_cancel is not None:
             try:
-                if asyncio.iscoroutinefunction(request_cancel):
-                    await request_cancel(level)
-                else:
-                    request_cancel(level)
+                result = request_cancel(level)
+                if inspect.isawaitable(result):
+                    await result
             except Exception:  # noqa: BLE001
                 logger.warning(
                     "Error requesting cancel (level=%s)", level, exc_info=True
@@ -904,6 +902,22 @@ class FoundationBackend:
 
         if handle:
             await handle.cleanup()
+            # Refresh the history summary sidecar so the next session-history
+            # scan doesn't have to re-read the finished transcript.
+            from amplifier_distro.server.apps.chat.session_history import (
+                invalidate_scan_cache,
+                write_session_summary,
+            )
+
+            session_dir = (
+                Path(AMPLIFIER_HOME).expanduser()
+                / PROJECTS_DIR
+                / handle.project_id
+                / "sessions"
+                / session_id
+            )
+            await asyncio.to_thread(write_session_summary, session_dir)
+            invalidate_scan_cache()
 
     async def stop(self) -> None:
         """Gracefully stop all session workers.
@@ -13,6 +13,7 @@ Exit criteria verified:
 7. Configurable repo names via CLI --name flag
 """
 
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -117,6 +118,26 @@ class TestCollectBackupFiles:
         files = collect_backup_files(amp_home)
         assert all(f.is_absolute() for f in files)
 
+    def test_skips_unreadable_subdirectory(self, amp_home):
+        """An unreadable directory is skipped (as rglob did), not fatal."""
+        locked = amp_home / conventions.MEMORY_DIR / "locked"
+        locked.mkdir()
+        (locked / "hidden.yaml").write_text("x: 1")
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if os.fspath(path) == str(locked):
+                raise PermissionError(13, "Permission denied", str(path))
+            return real_scandir(path)
+
+        with patch("amplifier_distro.backup.os.scandir", side_effect=scandir):
+            files = collect_backup_files(amp_home)
+
+        names = [f.name for f in files]
+        assert conventions.MEMORY_STORE_FILENAME in names
+        assert conventions.WORK_LOG_FILENAME in names
+        assert "hidden.yaml" not in names
+
 
 # ---------------------------------------------------------------------------
 #  Backup flow (mocked subprocess)
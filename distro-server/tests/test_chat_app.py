@@ -17,9 +17,9 @@ def _clean_services():
     reset_services()
 
 
-@pytest.fixture
-def chat_client() -> TestClient:
-    init_services(dev_mode=True)
+@pytest.fixture(scope="module")
+def _chat_test_client() -> TestClient:
+    """One app + client per module; routes look services up per request."""
     from amplifier_distro.server.apps.chat import manifest
 
     server = DistroServer()
@@ -27,6 +27,13 @@ def chat_client() -> TestClient:
     return TestClient(server.app)
 
 
+@pytest.fixture
+def chat_client(_chat_test_client) -> TestClient:
+    # Fresh MockBackend per test so sessions never leak between tests.
+    init_services(dev_mode=True)
+    return _chat_test_client
+
+
 class TestChatManifest:
     def test_manifest_name_is_chat(self):
         from amplifier_distro.server.apps.chat import manifest
@@ -423,6 +423,53 @@ class TestSyntheticStreaming:
         full = "".join(m["delta"] for m in delta_messages)
         assert full == "Object payload thinking"
 
+    @pytest.mark.asyncio
+    async def test_non_str_delta_does_not_suppress_synthesis(self):
+        """A delta whose text isn't a str must not mark the block streamed."""
+        from amplifier_distro.server.apps.chat.connection import ChatConnection
+
+        ws = make_ws([])
+        conn = ChatConnection(ws, make_backend(), make_config())
+
+        await conn.event_queue.put(
+            ("content_block:delta", {"block_index": 1, "delta": {"text": 42}})
+        )
+        await conn.event_queue.put(
+            ("content_block:end", {"block_index": 1, "block": {"text": "Synthesized"}})
+        )
+        await conn.event_queue.put(_STOP)
+
+        await conn._event_fanout_loop()
+
+        sent = [call.args[0] for call in ws.send_json.await_args_list]
+        deltas = [m["delta"] for m in sent if m.get("type") == "content_delta"]
+        assert "".join(deltas) == "Synthesized"
+
+    @pytest.mark.asyncio
+    async def test_str_delta_after_non_str_delta_marks_block_streamed(self):
+        """The later str delta counts, so content_end is not re-synthesized."""
+        from amplifier_distro.server.apps.chat.connection import ChatConnection
+
+        ws = make_ws([])
+        conn = ChatConnection(ws, make_backend(), make_config())
+
+        await conn.event_queue.put(
+            ("content_block:delta", {"block_index": 1, "delta": {"text": 42}})
+        )
+        await conn.event_queue.put(
+            ("content_block:delta", {"block_index": 1, "delta": "Streamed"})
+        )
+        await conn.event_queue.put(
+            ("content_block:end", {"block_index": 1, "block": {"text": "Streamed"}})
+        )
+        await conn.event_queue.put(_STOP)
+
+        await conn._event_fanout_loop()
+
+        sent = [call.args[0] for call in ws.send_json.await_args_list]
+        deltas = [m["delta"] for m in sent if m.get("type") == "content_delta"]
+        assert deltas == ["", "Streamed"]
+
 
 class TestOriginCheck:
     """Verify _auth_handshake origin restriction logic."""
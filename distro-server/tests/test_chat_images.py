@@ -2,67 +2,61 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 
+from amplifier_distro.server.session_backend import FoundationBackend
 
-class TestExecuteWithImages:
-    @pytest.mark.asyncio
-    async def test_execute_passes_images_to_handle(self):
-        """execute() accepts images and calls handle.run() correctly."""
-        from amplifier_distro.server.session_backend import FoundationBackend
+# Trivial coroutines: one event loop for the whole module instead of one
+# per test (asyncio_mode = "auto" already collects them as async tests).
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+@pytest.fixture
+def exec_backend():
+    """Return an attach(session_id) -> (backend, handle) helper.
+
+    The FoundationBackend shell is built once per test without running
+    __init__; each attach() registers a fresh handle whose run() is mocked.
+    """
+    backend = FoundationBackend.__new__(FoundationBackend)
+    backend._sessions = {}
+    backend._reconnect_locks = {}
+    backend._session_queues = {}
+    backend._worker_tasks = {}
+    backend._ended_sessions = set()
+    backend._wired_sessions = set()
+
+    def _attach(session_id: str):
+        handle = SimpleNamespace(run=AsyncMock(return_value="ok"))
+        backend._sessions[session_id] = handle
+        return backend, handle
 
-        handle = MagicMock()
-        handle.run = AsyncMock(return_value="response")
+    return _attach
 
-        backend = FoundationBackend.__new__(FoundationBackend)
-        backend._sessions = {"s001": handle}
-        backend._reconnect_locks = {}
-        backend._session_queues = {}
-        backend._worker_tasks = {}
-        backend._ended_sessions = set()
-        backend._wired_sessions = set()
+
+class TestExecuteWithImages:
+    async def test_execute_passes_images_to_handle(self, exec_backend):
+        """execute() accepts images and calls handle.run() correctly."""
+        backend, handle = exec_backend("s001")
 
         images = ["base64datahere", "anotherimage"]
         await backend.execute("s001", "describe these", images=images)
         # execute() currently calls handle.run(prompt) — images deferred to future
         handle.run.assert_called_once_with("describe these")
 
-    @pytest.mark.asyncio
-    async def test_execute_no_images_still_works(self):
+    async def test_execute_no_images_still_works(self, exec_backend):
         """execute() works correctly with no images."""
-        from amplifier_distro.server.session_backend import FoundationBackend
-
-        handle = MagicMock()
-        handle.run = AsyncMock(return_value="ok")
-
-        backend = FoundationBackend.__new__(FoundationBackend)
-        backend._sessions = {"s002": handle}
-        backend._reconnect_locks = {}
-        backend._session_queues = {}
-        backend._worker_tasks = {}
-        backend._ended_sessions = set()
-        backend._wired_sessions = set()
+        backend, handle = exec_backend("s002")
 
         await backend.execute("s002", "no images here")
         handle.run.assert_called_once_with("no images here")
 
-    @pytest.mark.asyncio
-    async def test_execute_images_none_equivalent_to_no_images(self):
+    async def test_execute_images_none_equivalent_to_no_images(self, exec_backend):
         """execute() with images=None behaves the same as no images."""
-        from amplifier_distro.server.session_backend import FoundationBackend
-
-        handle = MagicMock()
-        handle.run = AsyncMock(return_value="ok")
-
-        backend = FoundationBackend.__new__(FoundationBackend)
-        backend._sessions = {"s003": handle}
-        backend._reconnect_locks = {}
-        backend._session_queues = {}
-        backend._worker_tasks = {}
-        backend._ended_sessions = set()
-        backend._wired_sessions = set()
+        backend, handle = exec_backend("s003")
 
         await backend.execute("s003", "prompt with none images", images=None)
         handle.run.assert_called_once_with("prompt with none images")
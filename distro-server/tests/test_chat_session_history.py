@@ -363,6 +363,27 @@ class TestScanSessions:
         result = scan_sessions()
         assert result == []  # symlink escape caught, nothing returned
 
+    def test_skips_session_dir_symlink_escape(self, tmp_home):
+        """A session dir symlinked outside its sessions/ dir is skipped."""
+        from amplifier_distro.server.apps.chat.session_history import scan_sessions
+
+        outside = tmp_home / "outside-session"
+        outside.mkdir()
+        (outside / "transcript.jsonl").write_text(
+            json.dumps({"role": "user", "content": "leaked"}) + "\n"
+        )
+        _make_session(
+            tmp_home,
+            "-Users-test",
+            "real-session",
+            lines=[{"role": "user", "content": "hi"}],
+        )
+        sessions_dir = tmp_home / "projects" / "-Users-test" / "sessions"
+        (sessions_dir / "linked-session").symlink_to(outside)
+
+        result = scan_sessions()
+        assert [s["session_id"] for s in result] == ["real-session"]
+
     def test_skips_session_with_invalid_id_characters(self, tmp_home):
         """Session dirs with path-unsafe names are silently skipped."""
         from amplifier_distro.server.apps.chat.session_history import scan_sessions
@@ -384,6 +405,167 @@ class TestScanSessions:
         assert result[0]["session_id"] == "valid-session"
 
 
+# —— TestSummarySidecar ——————————————————————————————————————————————————
+
+
+class TestSummarySidecar:
+    def test_scan_writes_sidecar(self, tmp_home):
+        from amplifier_distro.server.apps.chat.session_history import (
+            SESSION_SUMMARY_FILENAME,
+            scan_sessions,
+        )
+
+        session_dir = _make_session(
+            tmp_home,
+            "-Users-test",
+            "sidecar-1",
+            lines=[{"role": "user", "content": "hello"}],
+        )
+
+        result = scan_sessions()
+
+        summary = json.loads((session_dir / SESSION_SUMMARY_FILENAME).read_text())
+        assert summary["revision"] == result[0]["revision"]
+        assert summary["message_count"] == 1
+        assert summary["last_user_message"] == "hello"
+
+    def test_scan_uses_sidecar_when_revision_matches(self, tmp_home):
+        from amplifier_distro.server.apps.chat.session_history import (
+            SESSION_SUMMARY_FILENAME,
+            scan_sessions,
+        )
+
+        session_dir = _make_session(
+            tmp_home,
+            "-Users-test",
+            "sidecar-2",
+            lines=[{"role": "user", "content": "hello"}],
+        )
+        revision = scan_sessions()[0]["revision"]
+        # Plant a sidecar with distinguishable values for the same revision
+        (session_dir / SESSION_SUMMARY_FILENAME).write_text(
+            json.dumps(
+                {
+                    "revision": revision,
+                    "message_count": 42,
+                    "last_user_message": "from sidecar",
+                }
+            )
+        )
+
+        result = scan_sessions()
+
+        assert result[0]["message_count"] == 42
+        assert result[0]["last_user_message"] == "from sidecar"
+
+    def test_scan_ignores_stale_sidecar(self, tmp_home):
+        from amplifier_distro.server.apps.chat.session_history import (
+            SESSION_SUMMARY_FILENAME,
+            scan_sessions,
+        )
+
+        session_dir = _make_session(
+            tmp_home,
+            "-Users-test",
+            "sidecar-3",
+            lines=[{"role": "user", "content": "hello"}],
+        )
+        (session_dir / SESSION_SUMMARY_FILENAME).write_text(
+            json.dumps(
+                {"revision": "0:0", "message_count": 42, "last_user_message": "old"}
+            )
+        )
+
+        result = scan_sessions()
+
+        assert result[0]["message_count"] == 1
+        assert result[0]["last_user_message"] == "hello"
+
+    def test_write_session_summary(self, tmp_home):
+        from amplifier_distro.server.apps.chat.session_history import (
+            SESSION_SUMMARY_FILENAME,
+            write_session_summary,
+        )
+
+        session_dir = _make_session(
+            tmp_home,
+            "-Users-test",
+            "sidecar-4",
+            lines=[
+                {"role": "user", "content": "q"},
+                {"role": "assistant", "content": "a"},
+            ],
+        )
+
+        write_session_summary(session_dir)
+
+        summary = json.loads((session_dir / SESSION_SUMMARY_FILENAME).read_text())
+        assert summary["message_count"] == 2
+        assert summary["last_user_message"] == "q"
+
+    def test_write_session_summary_noop_without_transcript(self, tmp_home):
+        from amplifier_distro.server.apps.chat.session_history import (
+            SESSION_SUMMARY_FILENAME,
+            write_session_summary,
+        )
+
+        session_dir = _make_session(tmp_home, "-Users-test", "sidecar-5")
+
+        write_session_summary(session_dir)
+
+        assert not (session_dir / SESSION_SUMMARY_FILENAME).exists()
+
+
+class TestScanSessionsCached:
+    def test_reuses_recent_scan(self, tmp_home):
+        from amplifier_distro.server.apps.chat import session_history as sh_mod
+
+        sh_mod.invalidate_scan_cache()
+        first = sh_mod.scan_sessions_cached()
+        _make_session(
+            tmp_home, "-Users-test", "late", lines=[{"role": "user", "content": "x"}]
+        )
+
+        assert sh_mod.scan_sessions_cached() is first
+
+    def test_invalidate_forces_rescan(self, tmp_home):
+        from amplifier_distro.server.apps.chat import session_history as sh_mod
+
+        sh_mod.invalidate_scan_cache()
+        assert sh_mod.scan_sessions_cached() == []
+        _make_session(
+            tmp_home, "-Users-test", "late", lines=[{"role": "user", "content": "x"}]
+        )
+
+        sh_mod.invalidate_scan_cache()
+        result = sh_mod.scan_sessions_cached()
+
+        assert [s["session_id"] for s in result] == ["late"]
+
+
+class TestIsValidSessionId:
+    @pytest.mark.parametrize(
+        "session_id",
+        ["abc", "sess-1", "a_b-C9", "0a1b2c3d-4e5f-6789-abcd-ef0123456789"],
+    )
+    def test_accepts_safe_ids(self, session_id):
+        from amplifier_distro.server.apps.chat.session_history import (
+            is_valid_session_id,
+        )
+
+        assert is_valid_session_id(session_id)
+
+    @pytest.mark.parametrize(
+        "session_id", ["", "a b", "../etc", "a/b", "abc\n", "caf\u00e9", "a.b"]
+    )
+    def test_rejects_unsafe_ids(self, session_id):
+        from amplifier_distro.server.apps.chat.session_history import (
+            is_valid_session_id,
+        )
+
+        assert not is_valid_session_id(session_id)
+
+
 # —— TestSessionHistoryEndpoint ————————————————————————————————————
 
 
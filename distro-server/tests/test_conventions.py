@@ -17,64 +17,41 @@ Exit criteria verified:
 import inspect
 import types
 
+import pytest
+
 from amplifier_distro import conventions
 
 
 class TestCanonicalValues:
     """Verify every canonical constant has the correct pinned value.
 
-    Antagonist note: Each test pins exactly one constant. If any value
-    changes without updating these tests, it will fail. This IS the
-    social contract.
+    Antagonist note: One table pins every constant. If any value changes
+    without updating this test, it will fail, and pytest's dict diff names
+    the constant that moved. This IS the social contract.
     """
 
-    def test_amplifier_home(self):
-        assert conventions.AMPLIFIER_HOME == "~/.amplifier"
-
-    def test_memory_dir(self):
-        assert conventions.MEMORY_DIR == "memory"
-
-    def test_memory_store_filename(self):
-        assert conventions.MEMORY_STORE_FILENAME == "memory-store.yaml"
-
-    def test_work_log_filename(self):
-        assert conventions.WORK_LOG_FILENAME == "work-log.yaml"
-
-    def test_transcript_filename(self):
-        assert conventions.TRANSCRIPT_FILENAME == "transcript.jsonl"
-
-    def test_keys_filename(self):
-        assert conventions.KEYS_FILENAME == "keys.env"
-
-    def test_settings_filename(self):
-        assert conventions.SETTINGS_FILENAME == "settings.yaml"
-
-    def test_server_dir(self):
-        assert conventions.SERVER_DIR == "server"
-
-    def test_server_socket(self):
-        assert conventions.SERVER_SOCKET == "server.sock"
-
-    def test_server_pid_file(self):
-        assert conventions.SERVER_PID_FILE == "server.pid"
-
-    def test_server_default_port(self):
-        assert conventions.SERVER_DEFAULT_PORT == 8400
-
-    def test_watchdog_pid_file(self):
-        assert conventions.WATCHDOG_PID_FILE == "watchdog.pid"
-
-    def test_watchdog_log_file(self):
-        assert conventions.WATCHDOG_LOG_FILE == "watchdog.log"
-
-    def test_service_name(self):
-        assert conventions.SERVICE_NAME == "amplifier-distro"
-
-    def test_launchd_label(self):
-        assert conventions.LAUNCHD_LABEL == "com.amplifier.distro"
-
-    def test_backup_repo_pattern(self):
-        assert conventions.BACKUP_REPO_PATTERN == "{github_handle}/amplifier-backup"
+    def test_all_canonical_values(self):
+        expected = {
+            "AMPLIFIER_HOME": "~/.amplifier",
+            "MEMORY_DIR": "memory",
+            "MEMORY_STORE_FILENAME": "memory-store.yaml",
+            "WORK_LOG_FILENAME": "work-log.yaml",
+            "TRANSCRIPT_FILENAME": "transcript.jsonl",
+            "KEYS_FILENAME": "keys.env",
+            "SETTINGS_FILENAME": "settings.yaml",
+            "SERVER_DIR": "server",
+            "SERVER_SOCKET": "server.sock",
+            "SERVER_PID_FILE": "server.pid",
+            "SERVER_DEFAULT_PORT": 8400,
+            "WATCHDOG_PID_FILE": "watchdog.pid",
+            "WATCHDOG_LOG_FILE": "watchdog.log",
+            "SERVICE_NAME": "amplifier-distro",
+            "LAUNCHD_LABEL": "com.amplifier.distro",
+            "BACKUP_REPO_PATTERN": "{github_handle}/amplifier-backup",
+        }
+        # getattr default: a removed constant shows up in the diff as None.
+        actual = {name: getattr(conventions, name, None) for name in expected}
+        assert actual == expected
 
 
 class TestStringConstants:
@@ -85,7 +62,7 @@ class TestStringConstants:
     non-empty string.
     """
 
-    FILENAME_CONSTANTS = [
+    FILENAME_CONSTANTS = (
         "MEMORY_STORE_FILENAME",
         "WORK_LOG_FILENAME",
         "TRANSCRIPT_FILENAME",
@@ -97,24 +74,34 @@ class TestStringConstants:
         "WATCHDOG_LOG_FILE",
         "SERVICE_NAME",
         "LAUNCHD_LABEL",
-    ]
+    )
 
-    DIRECTORY_CONSTANTS = [
+    DIRECTORY_CONSTANTS = (
         "MEMORY_DIR",
         "SERVER_DIR",
-    ]
+    )
+
+    @pytest.mark.parametrize("name", FILENAME_CONSTANTS)
+    def test_filename_constant_is_nonempty_string(self, name):
+        value = getattr(conventions, name)
+        assert isinstance(value, str), f"{name} should be str, got {type(value)}"
+        assert len(value) > 0, f"{name} should not be empty"
+
+    @pytest.mark.parametrize("name", DIRECTORY_CONSTANTS)
+    def test_directory_constant_is_nonempty_string(self, name):
+        value = getattr(conventions, name)
+        assert isinstance(value, str), f"{name} should be str, got {type(value)}"
+        assert len(value) > 0, f"{name} should not be empty"
 
-    def test_all_filename_constants_are_nonempty_strings(self):
-        for name in self.FILENAME_CONSTANTS:
-            value = getattr(conventions, name)
-            assert isinstance(value, str), f"{name} should be str, got {type(value)}"
-            assert len(value) > 0, f"{name} should not be empty"
 
-    def test_all_directory_constants_are_nonempty_strings(self):
-        for name in self.DIRECTORY_CONSTANTS:
-            value = getattr(conventions, name)
-            assert isinstance(value, str), f"{name} should be str, got {type(value)}"
-            assert len(value) > 0, f"{name} should not be empty"
+@pytest.fixture(scope="module")
+def backup_sets() -> tuple[frozenset[str], frozenset[str]]:
+    """(BACKUP_INCLUDE, BACKUP_EXCLUDE) as frozensets, built once.
+
+    conventions keeps them as lists (TestModulePurity allows only plain
+    data types), so the set view lives here.
+    """
+    return frozenset(conventions.BACKUP_INCLUDE), frozenset(conventions.BACKUP_EXCLUDE)
 
 
 class TestBackupSecurity:
@@ -125,20 +112,38 @@ class TestBackupSecurity:
     This is a security-critical assertion.
     """
 
-    def test_backup_exclude_contains_keys(self):
+    def test_backup_exclude_contains_keys(self, backup_sets):
         """KEYS_FILENAME must be excluded from backups (security: never backup keys)."""
-        assert conventions.KEYS_FILENAME in conventions.BACKUP_EXCLUDE
+        _include, exclude = backup_sets
+        assert conventions.KEYS_FILENAME in exclude
 
-    def test_backup_include_contains_memory_dir(self):
-        assert conventions.MEMORY_DIR in conventions.BACKUP_INCLUDE
+    def test_backup_include_contains_memory_dir(self, backup_sets):
+        include, _exclude = backup_sets
+        assert conventions.MEMORY_DIR in include
 
-    def test_backup_include_contains_settings(self):
-        assert conventions.SETTINGS_FILENAME in conventions.BACKUP_INCLUDE
+    def test_backup_include_contains_settings(self, backup_sets):
+        include, _exclude = backup_sets
+        assert conventions.SETTINGS_FILENAME in include
 
-    def test_backup_include_and_exclude_are_disjoint(self):
+    def test_backup_include_and_exclude_are_disjoint(self, backup_sets):
         """No item should appear in both include and exclude lists."""
-        overlap = set(conventions.BACKUP_INCLUDE) & set(conventions.BACKUP_EXCLUDE)
-        assert not overlap, f"Items in both INCLUDE and EXCLUDE: {overlap}"
+        include, exclude = backup_sets
+        overlap = include & exclude
+        assert not overlap, f"Items in both INCLUDE and EXCLUDE: {set(overlap)}"
+
+
+# The only value types conventions.py may define.
+_CONSTANT_TYPES = (str, int, list, dict)
+
+
+@pytest.fixture(scope="module")
+def conv_members() -> list[tuple[str, object]]:
+    """(name, value) for every conventions attribute, read once.
+
+    A module has no inherited members, so its __dict__ holds exactly what
+    inspect.getmembers() would report, without a getattr() per name.
+    """
+    return list(vars(conventions).items())
 
 
 class TestModulePurity:
@@ -149,42 +154,45 @@ class TestModulePurity:
     If you need logic, put it in a different module.
     """
 
-    def test_no_functions_defined(self):
+    def test_no_functions_defined(self, conv_members):
         """Module must have zero function definitions."""
         functions = [
             name
-            for name, obj in inspect.getmembers(conventions)
+            for name, obj in conv_members
             if inspect.isfunction(obj) and obj.__module__ == conventions.__name__
         ]
         assert functions == [], f"Unexpected functions in conventions: {functions}"
 
-    def test_no_classes_defined(self):
+    def test_no_classes_defined(self, conv_members):
         """Module must have zero class definitions."""
         classes = [
             name
-            for name, obj in inspect.getmembers(conventions)
+            for name, obj in conv_members
             if inspect.isclass(obj) and obj.__module__ == conventions.__name__
         ]
         assert classes == [], f"Unexpected classes in conventions: {classes}"
 
-    def test_all_public_names_are_data_not_callables(self):
+    def test_all_public_names_are_data_not_callables(self, conv_members):
         """Every public name must be str, int, list, or dict - no callables.
 
         Antagonist note: This catches accidentally defined lambdas,
         imported functions, or other non-constant objects.
         """
-        allowed_types = (str, int, list, dict)
-        for name in dir(conventions):
-            if name.startswith("_"):
-                continue
-            obj = getattr(conventions, name)
-            # Skip imported modules (e.g., if someone adds `import os`)
-            if isinstance(obj, types.ModuleType):
-                continue
-            assert isinstance(obj, allowed_types), (
-                f"{name} is {type(obj).__name__}, expected one of "
-                f"(str, int, list, dict)"
-            )
+        # Private names and imported modules (e.g. `import os`) are skipped.
+        offenders = [
+            f"{name} is {type(obj).__name__}"
+            for name, obj in conv_members
+            if not name.startswith("_")
+            and not isinstance(obj, types.ModuleType)
+            and not isinstance(obj, _CONSTANT_TYPES)
+        ]
+        assert offenders == [], f"Expected one of (str, int, list, dict): {offenders}"
+
+
+@pytest.fixture(scope="module")
+def conv_names(conv_members) -> frozenset[str]:
+    """Every name defined in conventions, for O(1) presence checks."""
+    return frozenset(name for name, _ in conv_members)
 
 
 class TestCrossModuleReferences:
@@ -195,22 +203,25 @@ class TestCrossModuleReferences:
     removed, these tests catch the breakage before runtime.
     """
 
-    def test_constants_used_by_server(self):
+    # server/cli.py: SERVER_DEFAULT_PORT; server/watchdog.py: WATCHDOG_*;
+    # service.py: SERVICE_NAME, LAUNCHD_LABEL; BACKUP_REPO_PATTERN is .format()ed.
+    REQUIRED_NAMES = (
+        "SERVER_DEFAULT_PORT",
+        "BACKUP_REPO_PATTERN",
+        "WATCHDOG_PID_FILE",
+        "WATCHDOG_LOG_FILE",
+        "SERVICE_NAME",
+        "LAUNCHD_LABEL",
+    )
+
+    @pytest.mark.parametrize("name", REQUIRED_NAMES)
+    def test_required_name_present(self, name, conv_names):
+        assert name in conv_names
+
+    def test_server_default_port(self):
         """server/cli.py uses SERVER_DEFAULT_PORT as its default."""
-        assert hasattr(conventions, "SERVER_DEFAULT_PORT")
         assert conventions.SERVER_DEFAULT_PORT == 8400
 
     def test_backup_repo_pattern_has_placeholder(self):
         """BACKUP_REPO_PATTERN is used with .format(github_handle=...)."""
-        assert hasattr(conventions, "BACKUP_REPO_PATTERN")
         assert "{github_handle}" in conventions.BACKUP_REPO_PATTERN
-
-    def test_constants_used_by_watchdog(self):
-        """server/watchdog.py uses WATCHDOG_PID_FILE and WATCHDOG_LOG_FILE."""
-        assert hasattr(conventions, "WATCHDOG_PID_FILE")
-        assert hasattr(conventions, "WATCHDOG_LOG_FILE")
-
-    def test_constants_used_by_service(self):
-        """service.py uses SERVICE_NAME and LAUNCHD_LABEL."""
-        assert hasattr(conventions, "SERVICE_NAME")
-        assert hasattr(conventions, "LAUNCHD_LABEL")
@@ -0,0 +1,77 @@
+"""Tests for the distro_settings.load() parse cache."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from amplifier_distro import conventions, distro_settings
+
+
+@pytest.fixture
+def settings_file(tmp_path, monkeypatch):
+    """Point DISTRO_HOME at tmp_path and start with an empty load cache."""
+    monkeypatch.setattr(conventions, "DISTRO_HOME", str(tmp_path))
+    monkeypatch.setattr(distro_settings, "_load_cache", None)
+    path = tmp_path / conventions.DISTRO_SETTINGS_FILENAME
+    path.write_text("slack:\n  hub_channel_name: first\n")
+    return path
+
+
+def _no_parse():
+    return patch.object(
+        distro_settings.yaml, "load", side_effect=AssertionError("re-parsed")
+    )
+
+
+def test_unchanged_file_is_served_from_cache(settings_file):
+    first = distro_settings.load()
+    with _no_parse():
+        second = distro_settings.load()
+    assert second == first
+    assert second.slack.hub_channel_name == "first"
+
+
+def test_size_change_invalidates_cache(settings_file):
+    distro_settings.load()
+    settings_file.write_text("slack:\n  hub_channel_name: second-longer\n")
+    assert distro_settings.load().slack.hub_channel_name == "second-longer"
+
+
+def test_mtime_change_invalidates_cache(settings_file):
+    distro_settings.load()
+    st = settings_file.stat()
+    settings_file.write_text("slack:\n  hub_channel_name: fresh\n")  # same size
+    os.utime(settings_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert distro_settings.load().slack.hub_channel_name == "fresh"
+
+
+def test_returned_objects_do_not_share_cached_state(settings_file):
+    first = distro_settings.load()
+    first.slack.hub_channel_name = "mutated"
+    with _no_parse():
+        assert distro_settings.load().slack.hub_channel_name == "first"
+
+
+def test_save_primes_cache(settings_file):
+    settings = distro_settings.DistroSettings()
+    settings.slack.hub_channel_name = "saved"
+    distro_settings.save(settings)
+    settings.slack.hub_channel_name = "changed-after-save"
+    with _no_parse():
+        assert distro_settings.load().slack.hub_channel_name == "saved"
+
+
+def test_file_replaced_during_parse_is_not_cached_as_new(settings_file):
+    """The cache key is the stat taken before the read, not after the parse."""
+    real_load = yaml.load
+
+    def load_then_replace(text, Loader):
+        result = real_load(text, Loader=Loader)
+        settings_file.write_text("slack:\n  hub_channel_name: replaced-later\n")
+        return result
+
+    with patch.object(distro_settings.yaml, "load", side_effect=load_then_replace):
+        assert distro_settings.load().slack.hub_channel_name == "first"
+    assert distro_settings.load().slack.hub_channel_name == "replaced-later"
@@ -0,0 +1,65 @@
+"""Provider status tests for the feature catalog.
+
+These tests validate:
+1. check_provider_status() answers from caller-supplied sources
+2. Each of key, settings.yaml entry and overlay include is checked
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from amplifier_distro import features
+from amplifier_distro.features import PROVIDERS, provider_bundle_uri
+
+_ANTHROPIC = PROVIDERS["anthropic"]
+
+
+@pytest.fixture
+def no_file_reads(monkeypatch):
+    """Fail if check_provider_status() reads its sources itself."""
+    monkeypatch.delenv(_ANTHROPIC.env_var, raising=False)
+    with patch.object(
+        features,
+        "provider_status_sources",
+        side_effect=AssertionError("sources were re-read"),
+    ):
+        yield
+
+
+def _sources(*, key: bool = True, module: bool = True, include: bool = True):
+    return (
+        {_ANTHROPIC.env_var: "sk-ant-test"} if key else {},
+        {_ANTHROPIC.module_id} if module else set(),
+        {provider_bundle_uri(_ANTHROPIC)} if include else set(),
+    )
+
+
+def test_configured_when_all_sources_agree(no_file_reads):
+    status = features.check_provider_status("anthropic", sources=_sources())
+    assert status == {
+        "has_key": True,
+        "in_settings": True,
+        "in_overlay": True,
+        "configured": True,
+    }
+
+
+@pytest.mark.parametrize(
+    ("missing", "field"),
+    [("key", "has_key"), ("module", "in_settings"), ("include", "in_overlay")],
+)
+def test_each_missing_source_is_reported(no_file_reads, missing, field):
+    status = features.check_provider_status(
+        "anthropic", sources=_sources(**{missing: False})
+    )
+    assert status[field] is False
+    assert status["configured"] is False
+    assert sum(status.values()) == 2
+
+
+def test_env_var_counts_as_key(no_file_reads, monkeypatch):
+    monkeypatch.setenv(_ANTHROPIC.env_var, "sk-ant-env")
+    status = features.check_provider_status("anthropic", sources=_sources(key=False))
+    assert status["has_key"] is True
+    assert status["configured"] is True
@@ -1,7 +1,8 @@
-"""Tests for atomic_write utility.
+"""Tests for atomic_write and read_env_file utilities.
 
 Verifies that file writes are crash-safe: the target file is never
-left in a truncated or partially-written state.
+left in a truncated or partially-written state, and that .env parsing
+is cached per (mtime, size) without sharing state between callers.
 """
 
 from __future__ import annotations
@@ -11,7 +12,7 @@ from unittest.mock import patch
 
 import pytest
 
-from amplifier_distro.fileutil import atomic_write
+from amplifier_distro.fileutil import atomic_write, read_env_file
 
 
 class TestAtomicWrite:
@@ -95,3 +96,32 @@ class TestAtomicWrite:
         atomic_write(target, "content")
         tmp_files = list(tmp_path.glob("*.tmp"))
         assert tmp_files == []
+
+
+class TestReadEnvFile:
+    """Verify read_env_file() parsing and caching."""
+
+    def test_missing_file_returns_empty(self, tmp_path: Path) -> None:
+        assert read_env_file(tmp_path / "keys.env") == {}
+
+    def test_parses_assignments(self, tmp_path: Path) -> None:
+        target = tmp_path / "keys.env"
+        target.write_text(
+            '# comment\n\nA="quoted"\n  B = plain  \nC=\'single\'\nnot-an-assignment\n'
+        )
+        assert read_env_file(target) == {"A": "quoted", "B": "plain", "C": "single"}
+
+    def test_unchanged_file_is_not_reread(self, tmp_path: Path) -> None:
+        target = tmp_path / "keys.env"
+        target.write_text('A="1"\n')
+        first = read_env_file(target)
+        first.clear()
+        with patch.object(Path, "read_text", side_effect=AssertionError("reread")):
+            assert read_env_file(target) == {"A": "1"}
+
+    def test_edit_is_picked_up(self, tmp_path: Path) -> None:
+        target = tmp_path / "keys.env"
+        target.write_text('A="1"\n')
+        read_env_file(target)
+        target.write_text('A="22"\n')
+        assert read_env_file(target) == {"A": "22"}
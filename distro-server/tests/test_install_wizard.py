@@ -0,0 +1,121 @@
+"""Install wizard detection tests.
+
+These tests validate:
+1. detect_environment() reports each tool independently when a probe fails
+2. _which_cached() re-resolves a binary once its TTL has passed
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from amplifier_distro import distro_settings
+from amplifier_distro.server.apps import install_wizard as wizard
+
+_BINARIES = {
+    "git": "/usr/bin/git",
+    "amplifier": "/usr/bin/amplifier",
+    "amplifier-tui": "/usr/bin/amplifier-tui",
+}
+
+
+@pytest.fixture
+def quiet_sources():
+    """Stub out everything detect_environment() reads besides the tools."""
+    with (
+        patch.object(wizard.stub, "is_stub_mode", return_value=False),
+        patch.object(
+            wizard.distro_settings,
+            "load",
+            return_value=distro_settings.DistroSettings(),
+        ),
+        patch.object(wizard.overlay, "read_overlay", return_value={}),
+        patch.object(wizard, "_workspace_candidates", return_value=[]),
+        patch.object(wizard, "detect_bridges", return_value={}),
+    ):
+        wizard._which_cache.clear()
+        yield
+        wizard._which_cache.clear()
+
+
+async def _fake_run_command(*args: str, timeout: float) -> str | None:
+    if args[0] == "gh":
+        return "octocat"
+    return "dev@example.com"
+
+
+class TestDetectEnvironmentProbes:
+    async def test_all_tools_found(self, quiet_sources):
+        with (
+            patch.object(wizard, "_run_command", side_effect=_fake_run_command),
+            patch.object(wizard.shutil, "which", side_effect=_BINARIES.get),
+        ):
+            result = await wizard.detect_environment()
+        assert result["github"] == {"handle": "octocat", "configured": True}
+        assert result["git"]["installed"] and result["git"]["configured"]
+        assert result["cli_installed"] and result["tui_installed"]
+
+    async def test_failing_gh_probe_leaves_other_tools_reported(self, quiet_sources):
+        async def run_command(*args: str, timeout: float) -> str | None:
+            if args[0] == "gh":
+                raise PermissionError("gh not executable")
+            return await _fake_run_command(*args, timeout=timeout)
+
+        with (
+            patch.object(wizard, "_run_command", side_effect=run_command),
+            patch.object(wizard.shutil, "which", side_effect=_BINARIES.get),
+        ):
+            result = await wizard.detect_environment()
+        assert result["github"] == {"handle": None, "configured": False}
+        assert result["git"] == {
+            "installed": True,
+            "configured": True,
+            "email": "dev@example.com",
+        }
+        assert result["cli_installed"] and result["tui_installed"]
+
+    async def test_failing_which_marks_only_that_tool_missing(self, quiet_sources):
+        def which(name: str) -> str | None:
+            if name == "amplifier":
+                raise OSError("unreadable PATH entry")
+            return _BINARIES.get(name)
+
+        with (
+            patch.object(wizard, "_run_command", side_effect=_fake_run_command),
+            patch.object(wizard.shutil, "which", side_effect=which),
+        ):
+            result = await wizard.detect_environment()
+        assert result["amplifier_cli"] == {"installed": False}
+        assert result["tui_installed"] is True
+        assert result["git"]["installed"] is True
+        assert result["github"]["configured"] is True
+
+
+class TestWhichCached:
+    @pytest.fixture(autouse=True)
+    def _empty_cache(self):
+        wizard._which_cache.clear()
+        yield
+        wizard._which_cache.clear()
+
+    def test_reuses_result_within_ttl(self):
+        with (
+            patch.object(wizard.time, "monotonic", side_effect=[100.0, 101.9]),
+            patch.object(wizard.shutil, "which", return_value="/bin/x") as which,
+        ):
+            assert wizard._which_cached("x") == "/bin/x"
+            assert wizard._which_cached("x") == "/bin/x"
+        which.assert_called_once_with("x")
+
+    def test_re_resolves_after_ttl(self):
+        with (
+            patch.object(
+                wizard.time,
+                "monotonic",
+                side_effect=[100.0, 100.0 + wizard._WHICH_TTL_S],
+            ),
+            patch.object(wizard.shutil, "which", side_effect=[None, "/bin/x"]) as which,
+        ):
+            assert wizard._which_cached("x") is None
+            assert wizard._which_cached("x") == "/bin/x"
+        assert which.call_count == 2
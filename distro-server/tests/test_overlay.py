@@ -166,3 +166,55 @@ class TestStaleOverlayMigration:
             "Provider bundle URI must still be present: "
             f"{provider_bundle_uri(_ANTHROPIC)!r}"
         )
+
+
+class TestUpdateIncludes:
+    """update_includes applies adds and removes in a single write."""
+
+    _A = "git+https://example.com/a@main"
+    _B = "git+https://example.com/b@main"
+    _C = "git+https://example.com/c@main"
+
+    def test_adds_and_removes_in_one_write(self, overlay_path):
+        overlay.ensure_overlay(_ANTHROPIC)
+        overlay.update_includes(add=[self._A])
+        with patch.object(
+            overlay, "_write_overlay", wraps=overlay._write_overlay
+        ) as write:
+            overlay.update_includes(add=[self._B], remove=[self._A])
+        assert write.call_count == 1
+        uris = overlay.get_includes()
+        assert self._A not in uris
+        assert uris[-1] == self._B
+        assert AMPLIFIER_START_URI in uris
+
+    def test_add_wins_over_remove(self, overlay_path):
+        overlay.ensure_overlay(_ANTHROPIC)
+        overlay.update_includes(add=[self._A], remove=[self._A])
+        assert overlay.get_includes().count(self._A) == 1
+
+    def test_add_wins_over_remove_for_existing_uri(self, overlay_path):
+        overlay.ensure_overlay(_ANTHROPIC)
+        overlay.update_includes(add=[self._A, self._B])
+        before = overlay.get_includes()
+        with patch.object(overlay, "_write_overlay") as write:
+            overlay.update_includes(add=[self._A], remove=[self._A])
+        write.assert_not_called()
+        assert overlay.get_includes() == before
+
+    def test_existing_include_order_is_kept(self, overlay_path):
+        overlay.ensure_overlay(_ANTHROPIC)
+        overlay.update_includes(add=[self._A, self._B])
+        before = overlay.get_includes()
+        overlay.update_includes(add=[self._C], remove=[before[1]])
+        assert overlay.get_includes() == [*before[:1], *before[2:], self._C]
+
+    def test_no_write_when_unchanged(self, overlay_path):
+        overlay.ensure_overlay(_ANTHROPIC)
+        with patch.object(overlay, "_write_overlay") as write:
+            overlay.update_includes(add=[AMPLIFIER_START_URI], remove=[self._A])
+        write.assert_not_called()
+
+    def test_noop_without_overlay(self, overlay_path):
+        overlay.update_includes(add=[self._A])
+        assert not overlay_path.exists()
@@ -9,21 +9,47 @@ These tests validate:
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
 from starlette.testclient import TestClient
 
+from amplifier_distro.server import app as server_app
 from amplifier_distro.server.app import DistroServer
 
+# Built-in apps, located relative to the imported package as server/cli.py does.
+_BUILTIN_APPS = Path(server_app.__file__).parent / "apps"
 
-def _make_client() -> TestClient:
-    """Create a test client with apps discovered."""
+
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    """Test client with apps discovered, built once for the module.
+
+    The root route looks up compute_phase on every request, so each test
+    can patch it without rebuilding the app.
+    """
     server = DistroServer()
-    builtin_apps = (
-        Path(__file__).parent.parent / "src" / "amplifier_distro" / "server" / "apps"
-    )
-    server.discover_apps(builtin_apps)
+    server.discover_apps(_BUILTIN_APPS)
     return TestClient(server.app)
 
 
+def _patch_phase(phase: str):
+    return patch(
+        "amplifier_distro.server.apps.settings.compute_phase", return_value=phase
+    )
+
+
+@pytest.fixture
+def ready_phase():
+    with _patch_phase("ready"):
+        yield
+
+
+@pytest.fixture
+def unconfigured_phase():
+    with _patch_phase("unconfigured"):
+        yield
+
+
+@pytest.mark.slow
 class TestRootLandingPage:
     """Verify GET / serves a landing page when configured, redirects when not.
 
@@ -32,52 +58,29 @@ class TestRootLandingPage:
     When ready, it serves an HTML landing page with app links.
     """
 
-    def test_root_returns_200_when_ready(self):
-        with patch(
-            "amplifier_distro.server.apps.settings.compute_phase",
-            return_value="ready",
-        ):
-            client = _make_client()
-            response = client.get("/")
-            assert response.status_code == 200
-
-    def test_root_returns_html_when_ready(self):
-        with patch(
-            "amplifier_distro.server.apps.settings.compute_phase",
-            return_value="ready",
-        ):
-            client = _make_client()
-            response = client.get("/")
-            content_type = response.headers.get("content-type", "")
-            assert "text/html" in content_type
-
-    def test_root_contains_amplifier_when_ready(self):
-        with patch(
-            "amplifier_distro.server.apps.settings.compute_phase",
-            return_value="ready",
-        ):
-            client = _make_client()
-            response = client.get("/")
-            assert "Amplifier" in response.text
-
-    def test_root_redirects_to_wizard_when_unconfigured(self):
+    def test_root_returns_200_when_ready(self, client, ready_phase):
+        response = client.get("/")
+        assert response.status_code == 200
+
+    def test_root_returns_html_when_ready(self, client, ready_phase):
+        response = client.get("/")
+        content_type = response.headers.get("content-type", "")
+        assert "text/html" in content_type
+
+    def test_root_contains_amplifier_when_ready(self, client, ready_phase):
+        response = client.get("/")
+        assert "Amplifier" in response.text
+
+    def test_root_redirects_to_wizard_when_unconfigured(
+        self, client, unconfigured_phase
+    ):
         """When unconfigured, GET / redirects to /apps/install-wizard/."""
-        with patch(
-            "amplifier_distro.server.apps.settings.compute_phase",
-            return_value="unconfigured",
-        ):
-            client = _make_client()
-            response = client.get("/", follow_redirects=False)
-            assert response.status_code == 307
-            assert response.headers["location"] == "/apps/install-wizard/"
-
-    def test_root_serves_landing_when_ready(self):
+        response = client.get("/", follow_redirects=False)
+        assert response.status_code == 307
+        assert response.headers["location"] == "/apps/install-wizard/"
+
+    def test_root_serves_landing_when_ready(self, client, ready_phase):
         """When configured (ready phase), GET / serves the landing page."""
-        with patch(
-            "amplifier_distro.server.apps.settings.compute_phase",
-            return_value="ready",
-        ):
-            client = _make_client()
-            response = client.get("/")
-            assert response.status_code == 200
-            assert "/apps/chat/" in response.text
+        response = client.get("/")
+        assert response.status_code == 200
+        assert "/apps/chat/" in response.text
@@ -10,6 +10,7 @@ import os
 import sys
 import unittest.mock
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -602,18 +603,19 @@ class TestSessionHandleCancel:
         """cancel() delegates to session.coordinator.request_cancel()."""
         from amplifier_distro.server.session_backend import _SessionHandle
 
-        mock_session = MagicMock()
-        mock_session.coordinator = MagicMock()
-        mock_session.coordinator.request_cancel = MagicMock()
+        request_cancel = MagicMock()
+        session = SimpleNamespace(
+            coordinator=SimpleNamespace(request_cancel=request_cancel)
+        )
 
         handle = _SessionHandle(
             session_id="s001",
             project_id="p001",
             working_dir=Path("/tmp"),
-            session=mock_session,
+            session=session,
         )
         await handle.cancel("graceful")
-        mock_session.coordinator.request_cancel.assert_called_once_with("graceful")
+        request_cancel.assert_called_once_with("graceful")
 
     async def test_cancel_no_session_does_not_raise(self):
         """cancel() returns early when session is None — must not raise."""
@@ -631,12 +633,11 @@ class TestSessionHandleCancel:
         """cancel() returns early when coordinator is absent — must not raise."""
         from amplifier_distro.server.session_backend import _SessionHandle
 
-        mock_session = MagicMock(spec=[])  # no coordinator attr
         handle = _SessionHandle(
             session_id="s003",
             project_id="p003",
             working_dir=Path("/tmp"),
-            session=mock_session,
+            session=SimpleNamespace(),  # no coordinator attr
         )
         await handle.cancel("graceful")  # must not raise
 
@@ -649,19 +650,20 @@ class TestSessionHandleCancel:
         """
         from amplifier_distro.server.session_backend import _SessionHandle
 
-        mock_session = MagicMock()
-        mock_session.coordinator = MagicMock()
-        mock_session.coordinator.request_cancel = AsyncMock()  # async — must be awaited
+        request_cancel = AsyncMock()  # async — must be awaited
+        session = SimpleNamespace(
+            coordinator=SimpleNamespace(request_cancel=request_cancel)
+        )
 
         handle = _SessionHandle(
             session_id="s-await-001",
             project_id="p-await-001",
             working_dir=Path("/tmp"),
-            session=mock_session,
+            session=session,
         )
         await handle.cancel("graceful")
 
-        mock_session.coordinator.request_cancel.assert_awaited_once_with("graceful")
+        request_cancel.assert_awaited_once_with("graceful")
 
 
 # ── FoundationBackend.execute ──────────────────────────────────────────